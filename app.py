@@ -18,50 +18,271 @@ Design principles
    ``materials.json`` via ``load_material`` or reading ``about.md``) use
    try/except. UI logic and plotting do not hide exceptions.
  - Background execution: Simulations run on a worker thread and results are
-   applied back on the Tk main thread via ``after`` callbacks.
+   handed back through a queue that the Tk main thread drains via ``after``.
 
 Data flow
 ---------
  - Inputs tab writes canonical values into ``self._params`` after validation.
- - ``_on_run`` spawns a thread that builds forcing, loads materials, runs the
-   model, then stores results in ``self.anim_data = { 'A': ..., 'B': ... }``.
+ - ``_on_run`` spawns a thread that builds forcing, loads materials and hands
+   the model runs to a process pool; ``_apply_sim_result`` then stores the
+   results in
+   ``self.anim_data = { 'A': ..., 'B': ... }`` on the main thread.
  - ``_show_results`` populates the Results and Term-by-term tabs; the Animation
    tab reads from ``anim_data`` for both the static frame and the playback.
 
 Threading model
 ---------------
- - Only the model run executes off the main thread. All Tk/CTk widget updates
-   are scheduled on the main thread (``self.after(..., ...)``).
+ - Only the model run executes off the main thread and it never touches Tk.
+   ``run_simulation`` itself runs in worker processes (``self._sim_pool``),
+   so the solver's Python callbacks do not hold the GIL against the Tk
+   thread; A and B of a comparison run side by side.
+   Results are posted to ``self._sim_queue``; ``_drain_sim_results`` polls it
+   with ``after`` only while a run is in flight.
 """
 
 from __future__ import annotations
 
 import importlib
-import json
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from itertools import chain
+import queue
 import threading
+import time
 from pathlib import Path
 from tkinter import messagebox
 import tkinter as tk
 import tkinter.font as tkfont
 from typing import Optional, Any, Mapping, cast
 
-import matplotlib.pyplot as plt
+import matplotlib as mpl
 from matplotlib.figure import Figure
+from matplotlib.transforms import Affine2D, Bbox
 import numpy as np
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
 import customtkinter as ctk
 import re
-import webbrowser
 
-from model import load_material, run_simulation, diurnal_forcing, DEFAULTS as MODEL_DEFAULTS, hour
+from model import load_material, read_materials, run_simulation, diurnal_forcing, nan_min_max, warm_up, DEFAULTS as MODEL_DEFAULTS, hour
 
+# Simplify long time-series paths before rasterizing: vertices that deviate
+# less than one pixel from the simplified path are dropped, and very long
+# paths are rendered in chunks. Trades sub-pixel detail for much less Agg work.
+mpl.rcParams['path.simplify'] = True
+mpl.rcParams['path.simplify_threshold'] = 1.0
+mpl.rcParams['agg.path.chunksize'] = 10000
 
-def load_material_keys(path: str = "materials.json"):
-    base = Path(__file__).parent
-    with open(base / path, "r") as f:
-        data = json.load(f)
-    return list(data.keys())
+
+@lru_cache(maxsize=None)
+def load_material_keys(path: str = "materials.json") -> tuple:
+    """Return the material keys of ``path`` in file order (cached per path).
+
+    A tuple, so the cached value can be shared safely by every caller (the
+    option menus only index and iterate it).
+    """
+    return tuple(read_materials(path))
+
+
+# inline link forms understood by the About renderer, matched in a single
+# pass. Compiled once and shared by every _tokenize_about call; each form is
+# a named group so a match can be dispatched on ``m.lastgroup`` (see
+# _LINK_DISPATCH).
+_LINK_RE = re.compile(
+    r'\[(?P<md_label>[^\]]+)\]\((?P<md>[^)]+)\)|'     # [text](url)
+    r'<(?P<angle_url>https?://[^>]+)>|'               # <https://...>
+    r'<(?P<angle_email>[\w\.-]+@[\w\.-]+\.[\w]+)>|'   # <user@example.org>
+    r'(?P<bare_url>https?://\S+)|'                    # bare https://...
+    r'(?P<email>[\w\.-]+@[\w\.-]+\.[\w]+)'            # bare user@example.org
+)
+
+# inline **bold** spans, looked for only in the text between links so a
+# '**' never swallows a link; a single '*' may appear inside the span
+_BOLD_RE = re.compile(r'\*\*((?:[^*]|\*(?!\*))+)\*\*')
+
+# lastgroup -> (label, url) for a _LINK_RE match. For [text](url) the last
+# group to close is the url group, which is why it is named 'md'.
+_LINK_DISPATCH = {
+    'md': lambda m: (m.group('md_label'), m.group('md')),
+    'angle_url': lambda m: (m.group('angle_url'), m.group('angle_url')),
+    'angle_email': lambda m: (m.group('angle_email'), f"mailto:{m.group('angle_email')}"),
+    'bare_url': lambda m: (m.group('bare_url'), m.group('bare_url')),
+    'email': lambda m: (m.group('email'), f"mailto:{m.group('email')}"),
+}
+
+
+def _append_text(s: str, tokens: list):
+    """Append the plain text between links, tagging ``**bold**`` spans."""
+    if '**' not in s:
+        # most fragments have no markup; skip the bold scan entirely
+        tokens.append((s, ('para',)))
+        return
+    pos = 0
+    for m in _BOLD_RE.finditer(s):
+        if m.start() > pos:
+            tokens.append((s[pos:m.start()], ('para',)))
+        tokens.append((m.group(1), ('bold', 'para')))
+        pos = m.end()
+    if pos < len(s):
+        tokens.append((s[pos:], ('para',)))
+
+
+def _tokenize_line(s: str, tokens: list, links: dict):
+    """Append the inline tokens of one About line (text, bold and links).
+
+    Shared by list items and plain paragraphs; new link tags are numbered
+    after the ones already in ``links``. Links are resolved before bold, so
+    a stray ``**`` cannot swallow them, and unmatched ``**`` stays plain
+    text:
+
+    >>> tokens, links = [], {}
+    >>> _tokenize_line('c ** d [x](http://y) <a@b.org> **e*f**', tokens, links)
+    >>> tokens[:4]
+    [('c ** d ', ('para',)), ('x', ('link', 'link0')), (' ', ('para',)), ('a@b.org', ('link', 'link1'))]
+    >>> tokens[4:]
+    [(' ', ('para',)), ('e*f', ('bold', 'para')), ('\\n', ())]
+    """
+    pos = 0
+    for m in _LINK_RE.finditer(s):
+        if m.start() > pos:
+            _append_text(s[pos:m.start()], tokens)
+        label_text, url = _LINK_DISPATCH[m.lastgroup](m)
+        tag_name = f'link{len(links)}'
+        links[tag_name] = url
+        tokens.append((label_text, ('link', tag_name)))
+        pos = m.end()
+    if pos < len(s):
+        _append_text(s[pos:], tokens)
+    tokens.append(('\n', ()))
+
+
+def _tokenize_about(content: str):
+    """Tokenize the About markdown into ``(text, tags)`` inserts.
+
+    Handles ``# `` headings, ``- `` list items, inline ``**bold**`` and the
+    link forms matched by ``_LINK_RE``. Returns ``(tokens, links)`` where
+    ``links`` maps each link tag name to its URL; link text carries both the
+    shared ``link`` style tag and its own tag name.
+    """
+    tokens = []
+    links = {}
+    for ln in content.splitlines():
+        ln_stripped = ln.strip()
+        if ln_stripped.startswith('# '):
+            tokens.append((ln_stripped[2:].strip() + '\n\n', ('h1',)))
+        elif ln_stripped == '':
+            tokens.append(('\n', ()))
+        elif ln_stripped.startswith('- '):
+            tokens.append(('• ', ('bullet',)))
+            _tokenize_line(ln_stripped[2:].strip(), tokens, links)
+        else:
+            _tokenize_line(ln, tokens, links)
+    return tokens, links
+
+
+def _open_url(url: str):
+    """Open ``url`` in the system browser (imported lazily on first click)."""
+    import webbrowser
+    webbrowser.open(url)
+
+
+# SEB flux series shown as arrows, in display order (K*, L*, G, H, E)
+_SEB_TERMS = ('Kstar', 'Lstar', 'G', 'H', 'E')
+
+# the time-series plots are thinned to at most this many samples per line,
+# a few per pixel of the widest panel
+_PLOT_MAX_POINTS = 2000
+
+
+def _seb_stack(out: Optional[dict]):
+    """Return the SEB flux series of a run stacked as an ``(Nt, 5)`` array, or None."""
+    if out is None:
+        return None
+    return np.stack([out[term] for term in _SEB_TERMS], axis=1)
+
+
+def _seb_range(seb):
+    """Return ``(min, max)`` over an ``(Nt, 5)`` SEB stack in one pass, or None."""
+    if seb is None or not seb.size:
+        return None
+    return nan_min_max(seb)
+
+
+def _flux_max(*ranges):
+    """Return the largest absolute SEB flux over per-run ``_seb_range`` values, or None."""
+    mags = [abs(v) for r in ranges if r is not None for v in r]
+    mags = [m for m in mags if np.isfinite(m)]
+    return max(mags) if mags else None
+
+
+def _profiles_C(out: Optional[dict]):
+    """Return the temperature profiles of a run converted to °C, or None."""
+    if out is None:
+        return None
+    tps = out.get('T_profiles')
+    if tps is None or not tps.size:
+        return None
+    return tps - 273.15
+
+
+def _plot_series(out: Optional[dict], t_h=None, seb=None):
+    """Return the derived series both results views plot for a run, or None.
+
+    Time in hours and Ta and Ts in °C are computed once per run here
+    instead of inside every plotting routine; the flux terms, including
+    Kup/Lup, are included as views (the Term-by-term panels flip the upward
+    fluxes with a y-flip line transform, see ``_TBT_PANELS``). Runs longer than
+    ``_PLOT_MAX_POINTS`` samples are thinned with a fixed stride.
+    ``t_h`` is an hours array to reuse when it matches the run's time grid.
+    ``seb_range`` spans all five SEB fluxes of the full run; pass the run's
+    ``_seb_stack`` as ``seb`` if it already exists.
+    """
+    if out is None:
+        return None
+    step = max(1, -(-len(out['t']) // _PLOT_MAX_POINTS))
+    t = out['t'][::step] / hour
+    if t_h is None or not np.array_equal(t_h, t):
+        t_h = t
+    s = {term: out[term][::step] for term in _SEB_TERMS + ('Kdown', 'Ldown', 'Kup', 'Lup')}
+    s.update({'t_h': t_h,
+              'Ta': out['Ta'][::step] - 273.15, 'Ts': out['Ts'][::step] - 273.15,
+              'seb_range': _seb_range(_seb_stack(out) if seb is None else seb)})
+    return s
+
+
+def _profile_range_C(tps_C):
+    """Return ``(Tmin, Tmax)`` over an array of °C profiles, or None."""
+    if tps_C is None:
+        return None
+    return nan_min_max(tps_C)
+
+
+@lru_cache(maxsize=64)
+def _ctk_color_to_mpl(c):
+    """Convert a hex string or numeric tuple CTk color to a Matplotlib color.
+
+    Hex strings are returned unchanged; tuples are coerced to RGB(A) floats
+    in 0..1. Returns None for anything else. Tk color names need the Tk
+    color parser and are handled by ``App._resolve_tk_color``.
+    """
+    if c is None:
+        return None
+    # hex strings are already acceptable for Matplotlib
+    if isinstance(c, str):
+        return c if c.startswith('#') else None
+    # tuple-like: try to coerce to an RGB or RGBA tuple of floats in 0..1
+    if isinstance(c, tuple) and all(isinstance(x, (int, float)) for x in c):
+        vals = [float(x) / 255.0 if (isinstance(x, (int,)) and x > 1) else float(x) for x in c]
+        # ensure length 3 or 4
+        if len(vals) >= 3:
+            if len(vals) == 3:
+                return (vals[0], vals[1], vals[2])
+            else:
+                # keep first 4 components as RGBA
+                return (vals[0], vals[1], vals[2], vals[3])
+        # fallthrough
+    return None
 
 
 def customtk_available() -> bool:
@@ -103,11 +324,53 @@ class App(ctk.CTk):
     # optional UI widgets that may or may not be created depending on layout
     # Narrow the type so static checkers know `configure` exists on non-None
     time_label: Optional[ctk.CTkLabel] = None
+    # (mtime, (tokens, links)) of the last parsed about.md, shared by instances
+    _about_cache: Optional[tuple] = None
+    # pending Tk `after` ids and figures torn down by _on_closing
+    _AFTER_ID_ATTRS = ('_preview_after_id', '_anim_after_id', '_temp_after_id', '_sim_after_id')
+    _FIGURE_ATTRS = ('fig_preview', 'fig_res', 'fig_temp', 'fig_temp_res', 'fig_anim')
+    # raster resolution of the Inputs previews, which are redrawn while the
+    # user edits. The canvas follows its grid cell, so this mostly sets the
+    # requested pixel size (figsize * dpi) and the text/line scale
+    _PREVIEW_DPI = 72
+    # validation key -> (parser method, entry widget attribute, readable name);
+    # dict order is the order in which a full validation checks the fields
+    _VALIDATORS = {
+        'Sb': ('_parse_nonneg', 'entry_Sb', 'Peak shortwave (W/m2)'),
+        'trise': ('_parse_hours', 'entry_trise', 'Sunrise time (h)'),
+        'tset': ('_parse_hours', 'entry_tset', 'Sunset time (h)'),
+        'Ldown': ('_parse_nonneg', 'entry_Ldown', 'Incoming longwave (W/m2)'),
+        'h': ('_parse_nonneg', 'entry_hcoef', 'Heat transfer coeff (W/m2K)'),
+        'Ta_mean': ('_parse_tempC_to_K', 'entry_Ta_mean', 'Air mean temp (°C)'),
+        'Ta_amp': ('_parse_nonneg', 'entry_Ta_amp', 'Air temperature amp (°C)'),
+        'beta': ('_parse_any', 'entry_beta', 'Bowen ratio (-)'),
+        'thickness_A': ('_parse_positive', 'entry_thickA', 'Thickness A (m)'),
+        'thickness_B': ('_parse_positive', 'entry_thickB', 'Thickness B (m)'),
+    }
     def __init__(self) -> None:
         ctk.set_appearance_mode('System')
         ctk.set_default_color_theme('blue')
         super().__init__()
         self.title('SEB demo')
+        # runtime state read by the event handlers; initialised up front so
+        # the handlers can use plain attribute reads instead of getattr
+        self._closed = False
+        self._running = False
+        self.anim_data = None
+        self._preview_after_id = None
+        self._anim_after_id = None
+        self._temp_after_id = None
+        self._sim_after_id = None
+        # results waiting for the Results / Term-by-term tabs (see
+        # _flush_results and _flush_term_by_term)
+        self._res_pending = None
+        self._tbt_pending = None
+        # hours array of the last run and the one each results line holds
+        self._plot_t_h = None
+        self._line_t = {}
+        # Temp & SEB state (the view itself is built with Term by term)
+        self._temp_static_key = None
+        self.temp_playing = False
         # default size and place the window near the top of the screen so the
         # whole window is visible on most displays. Prefer centering horizontally
         # and a small top margin.
@@ -135,21 +398,54 @@ class App(ctk.CTk):
         self.tab_tempseb = self.tabview.tab('Term by term')
         self.tab_about = self.tabview.tab('About')
 
-        # build tab content
+        # Tk color name -> RGB tuple (see _resolve_tk_color)
+        self._tk_color_cache = {}
+
+        # build tab content; the Results and Term-by-term figures are only
+        # created when their tab is first shown (see _ensure_tab_built)
         self._build_inputs_tab()
-        self._build_results_tab()
-        self._build_tempseb_tab()
         self._build_animation_tab()
         self._build_about_tab()
+        self._tab_builders = {'Results': self._build_results_tab,
+                              'Term by term': self._build_tempseb_tab}
 
-        # track tab changes: run simulation automatically when leaving Inputs tab
+        # track tab changes: run simulation automatically when leaving Inputs tab.
+        # CTkTabview is built on a segmented button (not a ttk.Notebook), so
+        # tab switches are observed through its ``command`` callback.
         self._last_tab = self.tabview.get()
-        # keep the poll after-id so we can cancel it on exit
-        self._poll_after_id = self.after(500, self._poll_tab)
+        self.tabview.configure(command=self._on_tab_changed)
 
         # ensure we clean up scheduled callbacks when the window is closed
         self.protocol('WM_DELETE_WINDOW', self._on_closing)
 
+        # start the simulation workers while the user is still on Inputs
+        self.after_idle(self._start_sim_pool)
+
+    def _start_sim_pool(self):
+        """Create the simulation process pool and start its workers.
+
+        Workers start on demand, so ``model.warm_up`` is submitted once per
+        worker to have their interpreter start-up and model import done
+        before the first run needs them.
+        """
+        if self._closed or self._sim_pool is not None:
+            return
+        self._sim_pool = ProcessPoolExecutor(max_workers=2)
+        for _ in range(2):
+            self._sim_pool.submit(warm_up)
+
+    def _stop_sim_pool(self):
+        """Shut the simulation pool down without waiting for a run in flight.
+
+        Runs that have not started yet are cancelled first; ``shutdown``
+        only gained ``cancel_futures`` in Python 3.9.
+        """
+        for fut in self._sim_futures:
+            fut.cancel()
+        if self._sim_pool is not None:
+            self._sim_pool.shutdown(wait=False)
+            self._sim_pool = None
+
     # --- builders for each tab to keep __init__ concise ---
     def _build_inputs_tab(self):
         """Create the Inputs tab (materials, parameters, preview plots)."""
@@ -157,9 +453,8 @@ class App(ctk.CTk):
         frm = ctk.CTkFrame(self.tab_inputs)
         frm.pack(fill='both', expand=True, padx=8, pady=8)
         # tune grid column weights so the optionmenus and entries fit the window
-        frm.grid_columnconfigure(0, weight=1, minsize=120, uniform='param')
-        frm.grid_columnconfigure(1, weight=1, minsize=120, uniform='param')
-        frm.grid_columnconfigure(2, weight=1, minsize=120, uniform='param')
+        # (Tk accepts a list of indices, so each frame takes a single call)
+        frm.grid_columnconfigure((0, 1, 2), weight=1, minsize=120, uniform='param')
 
         # capture the inputs frame background color
         # - CTk-native color for CTk widgets
@@ -178,21 +473,23 @@ class App(ctk.CTk):
         self.matA = ctk.StringVar(value=keys[0] if keys else 'concrete')
         self.opt_matA = ctk.CTkOptionMenu(frameA, values=keys, variable=self.matA, width=150)
         self.opt_matA.grid(row=0, column=1, sticky='e', padx=(6, 0))
-        # tooltip support for material A: show properties on hover
+        # tooltip support for material A: show properties on hover. A single
+        # borderless window is created once and shown/withdrawn on hover.
         self._tooltip_after_id = None
-        self._tooltip_win = None
+        self._tooltip_origin = None
+        self._tooltip_win = tk.Toplevel(self)
+        self._tooltip_win.wm_overrideredirect(True)
+        self._tooltip_win.wm_attributes('-topmost', True)
+        self._tooltip_win.withdraw()
+        self._tooltip_label = ctk.CTkLabel(self._tooltip_win, text='', justify='left', padx=8, pady=6)
+        self._tooltip_label.pack()
+        self._tooltip_win.bind('<Leave>', self._on_tooltip_leave)
+        # CTk widgets forward bind() to their internal canvas and label, so
+        # binding the option menu itself covers its child widgets
         self.opt_matA.bind('<Enter>', lambda e, w=self.opt_matA: self._schedule_show_material_tooltip(w, self.matA))
-        self.opt_matA.bind('<Leave>', lambda e: self._hide_material_tooltip())
-        # Some CTkOptionMenu implementations contain child widgets that receive
-        # enter/leave events instead of the container. Attach the same handlers
-        # to known children shortly after creation so tooltips reliably hide.
-        def _attach_children_for_optmenu(w, v):
-            for ch in w.winfo_children():
-                ch.bind('<Enter>', lambda e, ww=w, vv=v: self._schedule_show_material_tooltip(ww, vv))
-                ch.bind('<Leave>', lambda e: self._hide_material_tooltip())
-        self.after(50, lambda w=self.opt_matA, v=self.matA: _attach_children_for_optmenu(w, v))
+        self.opt_matA.bind('<Leave>', self._on_tooltip_leave)
         ctk.CTkLabel(frameA, text='Thickness A (m):').grid(row=1, column=0, sticky='w', pady=(6, 0))
-        self.thickA = ctk.DoubleVar(value=MODEL_DEFAULTS['thickness'])
+        self.thickA = ctk.StringVar(value=f"{MODEL_DEFAULTS['thickness']:g}")
         self.entry_thickA = ctk.CTkEntry(frameA, textvariable=self.thickA, width=120, justify='right')
         self.entry_thickA.grid(row=1, column=1, sticky='e', padx=(6, 0), pady=(6, 0))
 
@@ -206,8 +503,7 @@ class App(ctk.CTk):
         cmp_frame.grid(row=0, column=2, sticky='nsew', padx=(6, 0), pady=(6, 0))
         # give the right-hand column weight so the checkbox can expand
         # and be flush with the right edge of the window
-        cmp_frame.grid_columnconfigure(0, weight=1)
-        cmp_frame.grid_columnconfigure(1, weight=1)
+        cmp_frame.grid_columnconfigure((0, 1), weight=1)
         # show checkbox on the left and description on the right
         # command toggles Material B controls immediately
         self.cb_compare = ctk.CTkCheckBox(cmp_frame, text='', variable=self.compare_var, command=self._on_compare_toggle)
@@ -225,24 +521,33 @@ class App(ctk.CTk):
         self.opt_matB.grid(row=0, column=1, sticky='e', padx=(6, 0))
         # tooltip support for material B
         self.opt_matB.bind('<Enter>', lambda e, w=self.opt_matB: self._schedule_show_material_tooltip(w, self.matB))
-        self.opt_matB.bind('<Leave>', lambda e: self._hide_material_tooltip())
-        self.after(50, lambda w=self.opt_matB, v=self.matB: _attach_children_for_optmenu(w, v))
+        self.opt_matB.bind('<Leave>', self._on_tooltip_leave)
         self.lbl_thickB = ctk.CTkLabel(frameB, text='Thickness B (m):')
         self.lbl_thickB.grid(row=1, column=0, sticky='w', pady=(6, 0))
         # remember default color for toggling
         self._lbl_thickB_color_default = self.lbl_thickB.cget('text_color')
-        self.thickB = ctk.DoubleVar(value=MODEL_DEFAULTS['thickness'])
+        self.thickB = ctk.StringVar(value=f"{MODEL_DEFAULTS['thickness']:g}")
         self.entry_thickB = ctk.CTkEntry(frameB, textvariable=self.thickB, width=120, justify='right')
         self.entry_thickB.grid(row=1, column=1, sticky='e', padx=(6, 0), pady=(6, 0))
         # remember entry default text color so we can restore it reliably
         self._entry_thickB_text_color_default = self.entry_thickB.cget('text_color')
+        # Material B controls' (state, entry color, label color), keyed by
+        # the compare flag; see _apply_compare_state
+        self._matB_style = {
+            True: ('normal', self._entry_thickB_text_color_default, self._lbl_thickB_color_default),
+            False: ('disabled', 'gray', 'gray'),
+        }
 
         sep = ctk.CTkFrame(frm, height=2, fg_color='#7f7f7f')
         sep.grid(row=2, column=0, columnspan=3, sticky='ew', pady=(6, 8))
 
-        # runtime flags
-        self._running = False
-        self._closed = False
+        # finished runs are handed from the worker thread to the Tk thread
+        self._sim_queue = queue.Queue()
+        # worker processes for run_simulation (one per material of a
+        # comparison), kept for the whole session; see _start_sim_pool
+        self._sim_pool = None
+        # futures of the run in flight, cancelled by _stop_sim_pool
+        self._sim_futures = []
         # storage for validated parameters (filled by validators)
         self._params = {
             'thickness_A': float(MODEL_DEFAULTS['thickness']),
@@ -267,51 +572,46 @@ class App(ctk.CTk):
         self.param_col1.grid(row=3, column=1, sticky='nsew', padx=6, pady=4)
         self.param_col2 = ctk.CTkFrame(frm)
         self.param_col2.grid(row=3, column=2, sticky='nsew', padx=6, pady=4)
-        self.param_col0.grid_columnconfigure(0, weight=1)
-        self.param_col0.grid_columnconfigure(1, weight=1)
-        self.param_col1.grid_columnconfigure(0, weight=1)
-        self.param_col1.grid_columnconfigure(1, weight=1)
-        self.param_col2.grid_columnconfigure(0, weight=1)
-        self.param_col2.grid_columnconfigure(1, weight=1)
+        for col in (self.param_col0, self.param_col1, self.param_col2):
+            col.grid_columnconfigure((0, 1), weight=1)
 
-        frm.grid_rowconfigure(6, weight=1)
-        frm.grid_rowconfigure(7, weight=1)
+        frm.grid_rowconfigure((6, 7), weight=1)
 
         # Column 0
         ctk.CTkLabel(self.param_col0, text='Peak shortwave (W/m2):').grid(row=0, column=0, sticky='w', padx=(0,6), pady=(0,4))
-        self.Sb = ctk.DoubleVar(value=MODEL_DEFAULTS['Sb'])
+        self.Sb = ctk.StringVar(value=f"{MODEL_DEFAULTS['Sb']:g}")
         self.entry_Sb = ctk.CTkEntry(self.param_col0, textvariable=self.Sb, width=80, justify='right')
         self.entry_Sb.grid(row=0, column=1, sticky='e', pady=(0,4))
 
         ctk.CTkLabel(self.param_col0, text='Sunrise time (h):').grid(row=1, column=0, sticky='w', padx=(0,6), pady=(0,4))
         # model stores trise in seconds; present GUI field in hours
         trise_hours = float(MODEL_DEFAULTS['trise']) / float(hour)
-        self.trise_hr = ctk.DoubleVar(value=trise_hours)
+        self.trise_hr = ctk.StringVar(value=f"{trise_hours:g}")
         self.entry_trise = ctk.CTkEntry(self.param_col0, textvariable=self.trise_hr, width=80, justify='right')
         self.entry_trise.grid(row=1, column=1, sticky='e', pady=(0,4))
 
         ctk.CTkLabel(self.param_col0, text='Sunset time (h):').grid(row=2, column=0, sticky='w', padx=(0,6), pady=(0,4))
         tset_hours = float(MODEL_DEFAULTS['tset']) / float(hour)
-        self.tset_hr = ctk.DoubleVar(value=tset_hours)
+        self.tset_hr = ctk.StringVar(value=f"{tset_hours:g}")
         self.entry_tset = ctk.CTkEntry(self.param_col0, textvariable=self.tset_hr, width=80, justify='right')
         self.entry_tset.grid(row=2, column=1, sticky='e', pady=(0,4))
 
         # Column 1
         ctk.CTkLabel(self.param_col1, text='Incoming longwave (W/m2):').grid(row=0, column=0, sticky='w', padx=(0,6), pady=(0,4))
-        self.Ldown = ctk.DoubleVar(value=MODEL_DEFAULTS['Ldown'])
+        self.Ldown = ctk.StringVar(value=f"{MODEL_DEFAULTS['Ldown']:g}")
         self.entry_Ldown = ctk.CTkEntry(self.param_col1, textvariable=self.Ldown, width=80, justify='right')
         self.entry_Ldown.grid(row=0, column=1, sticky='e', pady=(0,4))
 
         ctk.CTkLabel(self.param_col1, text='Heat transfer coeff (W/m2K):').grid(row=1, column=0, sticky='w', padx=(0,6), pady=(0,4))
         # model uses key 'h' for the heat transfer coefficient
         hval = float(MODEL_DEFAULTS['h'])
-        self.hcoef = ctk.DoubleVar(value=hval)
+        self.hcoef = ctk.StringVar(value=f"{hval:g}")
         self.entry_hcoef = ctk.CTkEntry(self.param_col1, textvariable=self.hcoef, width=80, justify='right')
         self.entry_hcoef.grid(row=1, column=1, sticky='e', pady=(0,4))
 
         # Bowen ratio moved here (swapped with Air mean temp)
         ctk.CTkLabel(self.param_col1, text='Bowen ratio (-):').grid(row=2, column=0, sticky='w', padx=(0,6), pady=(0,4))
-        self.beta_var = ctk.DoubleVar(value=MODEL_DEFAULTS['beta'])
+        self.beta_var = ctk.StringVar(value=f"{MODEL_DEFAULTS['beta']:g}")
         self.entry_beta = ctk.CTkEntry(self.param_col1, textvariable=self.beta_var, width=80, justify='right')
         self.entry_beta.grid(row=2, column=1, sticky='e', pady=(0,4))
 
@@ -319,7 +619,7 @@ class App(ctk.CTk):
         ctk.CTkLabel(self.param_col2, text='Air temperature amp (°C):').grid(row=0, column=0, sticky='w', padx=(0,6), pady=(0,4))
         # model Ta_amp is in K (same scale as °C for amplitudes)
         ta_amp = float(MODEL_DEFAULTS['Ta_amp'])
-        self.Ta_amp_C = ctk.DoubleVar(value=ta_amp)
+        self.Ta_amp_C = ctk.StringVar(value=f"{ta_amp:g}")
         self.entry_Ta_amp = ctk.CTkEntry(self.param_col2, textvariable=self.Ta_amp_C, width=80, justify='right')
         self.entry_Ta_amp.grid(row=0, column=1, sticky='e', pady=(0,4))
 
@@ -327,88 +627,134 @@ class App(ctk.CTk):
         ctk.CTkLabel(self.param_col2, text='Air mean temp (°C):').grid(row=1, column=0, sticky='w', padx=(0,6), pady=(0,4))
         ta_mean_k = float(MODEL_DEFAULTS['Ta_mean'])
         # present mean air temperature in °C in the GUI
-        self.Ta_mean_C = ctk.DoubleVar(value=ta_mean_k - 273.15)
+        self.Ta_mean_C = ctk.StringVar(value=f"{ta_mean_k - 273.15:g}")
         self.entry_Ta_mean = ctk.CTkEntry(self.param_col2, textvariable=self.Ta_mean_C, width=80, justify='right')
         self.entry_Ta_mean.grid(row=1, column=1, sticky='e', pady=(0,4))
 
-        # Preview figures
-        self.fig_Ta = Figure(figsize=(8, 2))
-        self.fig_Ta.patch.set_facecolor(self._input_frame_bg)
-        self.canvas_Ta = FigureCanvasTkAgg(self.fig_Ta, master=frm)
-        self.canvas_Ta.get_tk_widget().grid(row=6, column=0, columnspan=3, padx=8, pady=(8, 4), sticky='nsew')
-        self.ax_Ta = self.fig_Ta.subplots(1, 1)
+        # Preview figure: Ta above Kdown/Ldown in one figure, so both share a
+        # single Agg renderer and Tk photo image. Tight layout is applied on
+        # each draw but reserves a small right margin so legends/spines are
+        # not clipped. A low-dpi raster (_PREVIEW_DPI) is plenty for these
+        # small previews and is cheaper to fill.
+        self.fig_preview = self._new_figure((8, 4), dpi=self._PREVIEW_DPI)
+        self.fig_preview.set_layout_engine('tight', rect=(0, 0, 0.98, 1))
+        self.canvas_preview = FigureCanvasTkAgg(self.fig_preview, master=frm)
+        self.canvas_preview.get_tk_widget().grid(row=6, rowspan=2, column=0, columnspan=3, padx=8, pady=8, sticky='nsew')
+        self.ax_Ta, self.ax_K = self.fig_preview.subplots(2, 1)
+
+        # preview grid: 24 h window with a 10-min timestep. The line artists
+        # are created once (animated, i.e. left out of full draws) and
+        # update_preview only replaces their y-data and blits them back.
+        self._preview_t = np.arange(0, 24 * hour + 600.0, 600.0)
+        # (Ta, S0) buffers diurnal_forcing fills on every preview update;
+        # the lines copy their data on set_ydata, so reuse is safe
+        self._preview_buf = (np.empty_like(self._preview_t), np.empty_like(self._preview_t))
+        # forcing parameters each preview axes is drawn for (None = not drawn)
+        self._preview_key = {}
+        t_h = self._preview_t / hour
+        zeros = np.zeros_like(self._preview_t)
+        self.line_Ta, = self.ax_Ta.plot(t_h, zeros, color='tab:blue', label='Ta (°C)', animated=True)
+        self.ax_Ta.set_xlabel('Time (h)')
+        self.ax_Ta.set_ylabel('Air temp (°C)')
+        self.ax_Ta.set_xlim(0, 24)
+        self.ax_Ta.grid(True, linestyle=':', alpha=0.5)
+        self.ax_Ta.legend(loc='upper right')
 
-        self.fig_K = Figure(figsize=(8, 2))
-        self.fig_K.patch.set_facecolor(self._input_frame_bg)
-        self.canvas_K = FigureCanvasTkAgg(self.fig_K, master=frm)
-        self.canvas_K.get_tk_widget().grid(row=7, column=0, columnspan=3, padx=8, pady=(4, 8), sticky='nsew')
-        self.ax_K = self.fig_K.subplots(1, 1)
+        self.line_K, = self.ax_K.plot(t_h, zeros, color='tab:orange', label='Kdown (W/m2)', animated=True)
+        # Ldown is constant over the day: a horizontal line artist spanning
+        # the axes, updated with a 2-point set_ydata
+        self.line_Ldown = self.ax_K.axhline(0.0, color='tab:purple', linestyle='--', label='Ldown (W/m2)', animated=True)
+        self.ax_K.set_xlabel('Time (h)')
+        self.ax_K.set_ylabel('Flux (W/m2)')
+        self.ax_K.set_xlim(0, 24)
+        self.ax_K.grid(True, linestyle=':', alpha=0.5)
+        self.ax_K.legend(loc='upper right')
+
+        # blit state per preview axes: its animated lines and the background
+        # captured after each full draw
+        self._preview_blit = {
+            self.ax_Ta: (self.line_Ta,),
+            self.ax_K: (self.line_K, self.line_Ldown),
+        }
+        self._preview_bg = {}
+        self.canvas_preview.mpl_connect('draw_event', self._on_preview_draw)
 
         # initial Inputs-tab state: enable/disable compare controls and
         # install preview traces so changing inputs updates the preview.
-        # ensure preview scheduling handle exists
-        self._preview_after_id = None
-
-        # initialize compare state so Material B controls are set correctly
-        enabled = bool(self.compare_var.get())
-
-        state = 'normal' if enabled else 'disabled'
 
-        # configure Material B optionmenu if present
-        if getattr(self, 'opt_matB', None) is not None:
-            self.opt_matB.configure(state=state)
-
-        # configure Material B thickness entry (and visual hint)
-        if getattr(self, 'entry_thickB', None) is not None:
-            self.entry_thickB.configure(state=state)
-            # visual hint: gray text when disabled (best-effort)
-            if not enabled:
-                self.entry_thickB.configure(text_color='gray')
-            else:
-                self.entry_thickB.configure(text_color=None)
-
-        # update animation layout (ensure static background matches new settings)
-        self.draw_anim_static()
+        # initialize compare state so Material B controls are set correctly;
+        # the animation axes do not exist yet and are drawn after a run
+        self._apply_compare_state()
 
         # draw an initial preview (best-effort)
         self.update_preview()
-            # install traces on the input variables to debounce preview updates
+        # install traces on the input variables to debounce preview updates
         self._install_preview_traces()
 
         # bind focus-out validation for inputs so correctness is checked when the
-        # user leaves the box (and before we run the simulation).
-        self.entry_Sb.bind('<FocusOut>', lambda e: self._validate_and_store('Sb'))
-        self.entry_trise.bind('<FocusOut>', lambda e: self._validate_and_store('trise'))
-        self.entry_tset.bind('<FocusOut>', lambda e: self._validate_and_store('tset'))
-        self.entry_Ldown.bind('<FocusOut>', lambda e: self._validate_and_store('Ldown'))
-        self.entry_hcoef.bind('<FocusOut>', lambda e: self._validate_and_store('h'))
-        self.entry_Ta_mean.bind('<FocusOut>', lambda e: self._validate_and_store('Ta_mean'))
-        self.entry_Ta_amp.bind('<FocusOut>', lambda e: self._validate_and_store('Ta_amp'))
-        self.entry_beta.bind('<FocusOut>', lambda e: self._validate_and_store('beta'))
-        # thickness entries already exist; bind them too
-        self.entry_thickA.bind('<FocusOut>', lambda e: self._validate_and_store('thickness_A'))
-        self.entry_thickB.bind('<FocusOut>', lambda e: self._validate_and_store('thickness_B'))
+        # user leaves the box (and before we run the simulation). This is also
+        # where a typed value gets previewed; see _do_preview_update.
+        self._entry_keys = {
+            self.entry_Sb: 'Sb', self.entry_trise: 'trise', self.entry_tset: 'tset',
+            self.entry_Ldown: 'Ldown', self.entry_hcoef: 'h', self.entry_Ta_mean: 'Ta_mean',
+            self.entry_Ta_amp: 'Ta_amp', self.entry_beta: 'beta',
+            self.entry_thickA: 'thickness_A', self.entry_thickB: 'thickness_B',
+        }
+        for entry, key in self._entry_keys.items():
+            entry.bind('<FocusOut>', lambda e, k=key: self._on_entry_focus_out(k))
+        # validation key -> input variable (see _var_for_key)
+        self._key_to_var = {
+            'Sb': self.Sb, 'trise': self.trise_hr, 'tset': self.tset_hr,
+            'Ldown': self.Ldown, 'h': self.hcoef, 'Ta_mean': self.Ta_mean_C,
+            'Ta_amp': self.Ta_amp_C, 'beta': self.beta_var,
+            'thickness_A': self.thickA, 'thickness_B': self.thickB,
+        }
 
         # run an initial validation to populate self._params
         self._validate_and_store()
 
     def _build_results_tab(self):
-        """Create the Results tab figure and axes container."""
-        # Results: create a 2x2 grid. When only one material is present we use
-        # the left column; when comparing we fill both columns.
-        self.fig_res = Figure(figsize=(8, 9))
-        self.fig_res.patch.set_facecolor(self._input_frame_bg)
+        """Create the Results tab figure, axes and persistent line artists."""
+        # Results: a 2x1 grid for a single material and a 2x2 grid when
+        # comparing. Both layouts are built once and only their visibility is
+        # toggled; refreshing a run just swaps line data.
+        self.fig_res = self._new_figure((8, 9))
         self.canvas_res = FigureCanvasTkAgg(self.fig_res, master=self.tab_results)
         self.canvas_res.get_tk_widget().pack(fill='both', expand=True)
-        # 2 rows x 2 cols, keep as 2D array for easy indexing
-        self.axs_res = self.fig_res.subplots(2, 2, squeeze=False)
+        # keyed by compare flag; each is a 2D array for easy indexing
+        self._res_axes = {}
+        self._res_lines = {}
+        for compare, ncols in ((False, 1), (True, 2)):
+            gs = self.fig_res.add_gridspec(2, ncols)
+            axs = np.empty((2, ncols), dtype=object)
+            for j in range(ncols):
+                axs[0][j] = self.fig_res.add_subplot(gs[0, j])
+                self._res_lines[axs[0][j]] = self._init_results_axes(axs[0][j], 'ts')
+                axs[1][j] = self.fig_res.add_subplot(gs[1, j])
+                self._res_lines[axs[1][j]] = self._init_results_axes(axs[1][j], 'energy')
+                axs[0][j].set_visible(not compare)
+                axs[1][j].set_visible(not compare)
+            self._res_axes[compare] = axs
+        self.axs_res = self._res_axes[False]
+
+    def _init_results_axes(self, ax, kind: str):
+        """Decorate a Results axes and return its (empty) lines keyed by term."""
+        if kind == 'ts':
+            specs = (('Ta', 'k'), ('Ts', 'r'))
+            ax.set_ylabel('T (°C)')
+        else:
+            specs = (('K*', 'orange'), ('L*', 'magenta'), ('H', 'green'), ('E', 'blue'), ('G', 'saddlebrown'))
+            ax.set_ylabel('Flux (W/m2)')
+        lines = {label: ax.plot([], [], color=color, label=label)[0] for label, color in specs}
+        ax.set_xlabel('Time (h)')
+        ax.legend(loc='upper right', fontsize='small')
+        return lines
 
     def _build_tempseb_tab(self):
         """Create the Term-by-term tab (Temp & SEB compact view)."""
         # small Temp profile figure exists for programmatic use but is not
         # shown in the UI (Term-by-term grid is the visible summary)
-        self.fig_temp = Figure(figsize=(6, 3))
-        self.fig_temp.patch.set_facecolor(self._input_frame_bg)
+        self.fig_temp = self._new_figure((6, 3))
         self.canvas_temp = FigureCanvasTkAgg(self.fig_temp, master=self.tab_tempseb)
         self.ax_temp = self.fig_temp.subplots(1, 1)
 
@@ -417,23 +763,31 @@ class App(ctk.CTk):
         self.temp_time_var = ctk.IntVar(value=0)
         # slider and playback controls are intentionally not packed into the
         # UI (we don't show animation controls in the Term-by-term tab)
-        self.temp_slider = ctk.CTkSlider(self.tab_tempseb, from_=0, to=1, number_of_steps=1, command=lambda v: self.update_tempseb(int(float(v))))
+        self.temp_slider = ctk.CTkSlider(self.tab_tempseb, from_=0, to=1, number_of_steps=1, command=self._on_temp_slider)
+        self._temp_idx = None
+        self._temp_lims = None
+        self._temp_lines = {}
+        self._temp_seb = {}
+        # profile lines and SEB arrows are animated artists blitted over a
+        # background cached on every full draw of canvas_temp
+        self._temp_artists = []
+        self._temp_bg = None
+        self.canvas_temp.mpl_connect('draw_event', self._on_temp_draw)
         # playback controls for Temp & SEB
-        self.temp_playing = False
         self.temp_play_btn = ctk.CTkButton(self.tab_tempseb, text='Play', command=self.toggle_temp_playback, state='disabled')
 
         # Also provide a copy of the Results plots in the Term by Term tab so
         # users can see the summary plots alongside the temporal profile view.
         # Use a 3x3 grid so each panel can show both Material A and B together
         # (with a legend) as requested.
-        self.fig_temp_res = Figure(figsize=(9, 9))
-        self.fig_temp_res.patch.set_facecolor(self._input_frame_bg)
+        self.fig_temp_res = self._new_figure((9, 9))
         self.canvas_temp_res = FigureCanvasTkAgg(self.fig_temp_res, master=self.tab_tempseb)
         self.canvas_temp_res.get_tk_widget().pack(fill='both', expand=True)
         # term-by-term comparison: 3 rows x 2 cols. We'll plot the main
         # terms (Ts, K*, L*, H, E, G) in the first two rows and use the third
         # row for derived comparisons (residual, Ts diff, E diff).
         self.axs_temp_res = self.fig_temp_res.subplots(3, 2, squeeze=False)
+        self._tbt_lines = self._init_term_by_term_axes()
 
     def _build_animation_tab(self):
         """Create the Animation tab and controls.
@@ -441,24 +795,25 @@ class App(ctk.CTk):
         Controls live in a top bar; the figure is a single axes stored in
         ``self.ax_anim`` with the canvas below the bar.
         """
-        # create figure and single axes for animation
-        self.fig_anim = Figure(figsize=(8, 3))
-        self.fig_anim.patch.set_facecolor(self._input_frame_bg)
+        # create figure and single axes for animation; a fixed 72 dpi keeps
+        # the Agg raster (and so the per-frame fill cost) small
+        self.fig_anim = self._new_figure((8, 3), dpi=72)
         self.ax_anim = self.fig_anim.subplots(1, 1)
 
         # controls across the top
         self.anim_ctrl_frame = ctk.CTkFrame(self.tab_animation)
         self.anim_ctrl_frame.pack(side='top', fill='x', padx=8, pady=6)
-        # configure spacer columns so the control group is centered
-        # create 7 columns and give the outermost columns weight so controls center
-        for _c in range(7):
-            self.anim_ctrl_frame.grid_columnconfigure(_c, weight=0)
-        self.anim_ctrl_frame.grid_columnconfigure(0, weight=1)
-        self.anim_ctrl_frame.grid_columnconfigure(6, weight=1)
+        # configure spacer columns so the control group is centered: of the
+        # 7 columns only the outermost get weight (the rest keep Tk's 0)
+        self.anim_ctrl_frame.grid_columnconfigure((0, 6), weight=1)
         # Time label omitted per UI preference (no time next to Start/Reset)
         # animation speed: prefer GUI-only default
         sv = float(self.GUIDEFAULTS.get('speed', 1.0))
         self.speed_var = ctk.DoubleVar(value=sv)
+        # playback frame periods follow the speed entry; they are recomputed
+        # on edits instead of being read back from Tcl every frame
+        self._on_speed_change()
+        self.speed_var.trace_add('write', self._on_speed_change)
         ctk.CTkLabel(self.anim_ctrl_frame, text='Speed:').grid(row=0, column=1, sticky='w')
         ctk.CTkEntry(self.anim_ctrl_frame, textvariable=self.speed_var, width=80).grid(row=0, column=2, padx=(4, 8))
         self.btn_start = ctk.CTkButton(self.anim_ctrl_frame, text='Start', command=self.toggle_animation, state='disabled')
@@ -471,10 +826,20 @@ class App(ctk.CTk):
         self.canvas_anim = FigureCanvasTkAgg(self.fig_anim, master=self.tab_animation)
         self.canvas_anim.get_tk_widget().pack(side='top', fill='both', expand=True)
 
-        # animation state placeholders
+        # animation state placeholders (anim_data is set up in __init__)
         self.animating = False
         self.anim_idx = 0
-        self.anim_data = None
+
+        # blitting state: the static background is re-captured after every
+        # full draw (initial draw, resize) and playback only redraws the
+        # animated artists on top of it
+        self._anim_bg = None
+        self._anim_blit_bbox = None
+        self._anim_lines = {}
+        self._anim_seb = {}
+        self._anim_lims = None
+        self._anim_artists = []
+        self.canvas_anim.mpl_connect('draw_event', self._on_anim_draw)
 
     def _build_about_tab(self):
         """Create the About tab and display contents of about.md.
@@ -491,12 +856,16 @@ class App(ctk.CTk):
         frm.pack(fill='both', expand=True, padx=8, pady=8)
 
     
-        # Load about.md from repository root
+        # Load about.md from repository root; the tokenized content is cached
+        # on the class and only re-parsed when the file changes
         try:
             p = Path(__file__).parent / 'about.md'
-            content = p.read_text(encoding='utf-8')
+            mtime = p.stat().st_mtime
+            if App._about_cache is None or App._about_cache[0] != mtime:
+                App._about_cache = (mtime, _tokenize_about(p.read_text(encoding='utf-8')))
+            tokens, links = App._about_cache[1]
         except Exception:
-            content = 'About information not available.'
+            tokens, links = _tokenize_about('About information not available.')
 
         # Compute tkinter background color from CTk color (if available)
         
@@ -536,14 +905,6 @@ class App(ctk.CTk):
         # Render about.md into a single, read-only Tk Text widget so we get
         # reliable wrapping and layout across platforms. We keep inline bold
         # and clickable links by using text tags.
-        link_re = re.compile(
-            r'\[([^\]]+)\]\(([^)]+)\)|'      # [text](url)
-            r'<(https?://[^>]+)>|'                # <https://...>
-            r'<([\w\.-]+@[\w\.-]+\.[\w]+)>|' # <user@example.org>
-            r'(https?://\S+)|'                   # bare https://...
-            r'([\w\.-]+@[\w\.-]+\.[\w]+)'
-        )
-
         # create a read-only Text widget
         txt = tk.Text(frm, wrap='word', bd=0, relief='flat')
         # background color should match the CTk frame if available
@@ -559,124 +920,62 @@ class App(ctk.CTk):
         txt.tag_configure('para', font=body_font)
         txt.tag_configure('bullet', font=body_font)
 
-        link_count = 0
-
-        def insert_with_bold(target, s, tag='para'):
-            # simple **bold** scanner
-            i = 0
-            while i < len(s):
-                if s.startswith('**', i):
-                    j = s.find('**', i + 2)
-                    if j != -1:
-                        inner = s[i+2:j]
-                        if inner:
-                            target.insert('end', inner, ('bold', tag))
-                        i = j + 2
-                        continue
-                # no bold start -> insert until next ** or end
-                next_pos = s.find('**', i)
-                if next_pos == -1:
-                    target.insert('end', s[i:], (tag,))
-                    break
-                else:
-                    target.insert('end', s[i:next_pos], (tag,))
-                    i = next_pos
-
-        for ln in content.splitlines():
-            ln_stripped = ln.strip()
-            if ln_stripped.startswith('# '):
-                txt.insert('end', ln_stripped[2:].strip() + '\n\n', ('h1',))
-                continue
-            if ln_stripped == '':
-                txt.insert('end', '\n')
-                continue
-
-            # lists
-            if ln_stripped.startswith('- '):
-                item = ln_stripped[2:].strip()
-                txt.insert('end', '• ', ('bullet',))
-                # process inline links and bold inside item
-                pos = 0
-                for m in link_re.finditer(item):
-                    if m.start() > pos:
-                        insert_with_bold(txt, item[pos:m.start()])
-                    if m.group(1):
-                        label_text = m.group(1); url = m.group(2)
-                    elif m.group(3):
-                        label_text = m.group(3); url = m.group(3)
-                    elif m.group(4):
-                        label_text = m.group(4); url = f'mailto:{m.group(4)}'
-                    elif m.group(5):
-                        label_text = m.group(5); url = m.group(5)
-                    else:
-                        label_text = m.group(6); url = f'mailto:{m.group(6)}'
-                    tag_name = f'link{link_count}'
-                    txt.insert('end', label_text, (tag_name,))
-                    # configure tag and binding
-                    txt.tag_configure(tag_name, foreground='blue', underline=True)
-                    txt.tag_bind(tag_name, '<Button-1>', lambda e, u=url: webbrowser.open(u))
-                    link_count += 1
-                    pos = m.end()
-                if pos < len(item):
-                    insert_with_bold(txt, item[pos:])
-                txt.insert('end', '\n')
-                continue
-
-            # non-list line: handle links and inline bold
-            pos = 0
-            for m in link_re.finditer(ln):
-                if m.start() > pos:
-                    insert_with_bold(txt, ln[pos:m.start()])
-                if m.group(1):
-                    label_text = m.group(1); url = m.group(2)
-                elif m.group(3):
-                    label_text = m.group(3); url = m.group(3)
-                elif m.group(4):
-                    label_text = m.group(4); url = f'mailto:{m.group(4)}'
-                elif m.group(5):
-                    label_text = m.group(5); url = m.group(5)
-                else:
-                    label_text = m.group(6); url = f'mailto:{m.group(6)}'
-                tag_name = f'link{link_count}'
-                txt.insert('end', label_text, (tag_name,))
-                txt.tag_configure(tag_name, foreground='blue', underline=True)
-                txt.tag_bind(tag_name, '<Button-1>', lambda e, u=url: webbrowser.open(u))
-                link_count += 1
-                pos = m.end()
-            if pos < len(ln):
-                insert_with_bold(txt, ln[pos:])
-            txt.insert('end', '\n')
+        # replay the cached token stream in a single insert (Tk accepts any
+        # number of text/tag-list pairs); all links share one style tag and a
+        # single click binding that resolves the URL from the link's own tag
+        txt.tag_configure('link', foreground='blue', underline=True)
+        if tokens:
+            txt.insert('end', *chain.from_iterable(tokens))
+        self._about_links = links
+        txt.tag_bind('link', '<Button-1>', self._on_about_link)
 
         # make readonly
         txt.configure(state='disabled')
         txt.pack(fill='both', expand=True, padx=4, pady=4)
 
-    def _poll_tab(self):
-        """Periodic UI poll.
+    def _on_about_link(self, event):
+        """Open the URL of the About link under the mouse pointer."""
+        for tag in event.widget.tag_names('current'):
+            url = self._about_links.get(tag)
+            if url is not None:
+                _open_url(url)
+                return
+
+    def _on_tab_changed(self, event=None):
+        """Handle a tab switch in the main tabview.
 
         - Starts a run when leaving Inputs.
-        - If entering Results/Term-by-term and results exist, triggers redraw.
+        - If entering Results or Term-by-term, draws results still pending
+          for that tab.
+        - If returning to Inputs, brings the previews up to date with edits
+          that arrived while another tab was shown.
         """
-        cur = self.tabview.get()
-        # guard: don't run if the app is closed or widget destroyed
-        if getattr(self, '_closed', False):
+        # the tabview command only fires from a click on a live window, so
+        # the closed flag is the only guard needed
+        if self._closed:
             return
-        if hasattr(self, 'winfo_exists') and not self.winfo_exists():
-            return
-        if cur != getattr(self, '_last_tab', None):
-            last = getattr(self, '_last_tab', None)
+        cur = self.tabview.get()
+        # _last_tab and _running are set before the command is registered
+        if cur != self._last_tab:
             # if we just left the Inputs tab, start a simulation
-            if last == 'Inputs' and not getattr(self, '_running', False):
+            if self._last_tab == 'Inputs' and not self._running:
                 self._on_run()
-            # if we entered Results or Term by term after a run, (re)draw outputs
-            if cur in ('Results', 'Term by term'):
-                anim = getattr(self, 'anim_data', None)
-                if anim and anim.get('A') is not None:
-                    outA = anim.get('A'); outB = anim.get('B')
-                    mA = anim.get('A_mat'); mB = anim.get('B_mat')
-                    self.after(0, lambda: self._show_results(outA, outB, mA, mB))
+            # the Results and Term-by-term tabs are built on their first
+            # visit and their plots drawn lazily when first shown after a run
+            self._ensure_tab_built(cur)
+            if cur == 'Results':
+                self.after(0, self._flush_results)
+            elif cur == 'Term by term':
+                self.after(0, self._flush_term_by_term)
+            elif cur == 'Inputs':
+                self.after(0, self.update_preview)
         self._last_tab = cur
-        self._poll_after_id = self.after(300, self._poll_tab)
+
+    def _ensure_tab_built(self, name: str):
+        """Build a lazily created tab's figures and widgets on its first use."""
+        build = self._tab_builders.pop(name, None)
+        if build is not None:
+            build()
 
     def update_preview(self):
         """Update the small preview plots on the Inputs tab.
@@ -685,101 +984,159 @@ class App(ctk.CTk):
         using the current (validated) input parameters.
         """
         # guard: don't run if window is closed/destroyed
-        if getattr(self, '_closed', False):
+        if self._closed:
             return
-        if hasattr(self, 'winfo_exists') and not self.winfo_exists():
+        if not self.winfo_exists():
+            return
+        # the previews are only seen on the Inputs tab; a skipped update
+        # leaves the canvas keys stale, so the refresh on re-entry (see
+        # _on_tab_changed) redraws exactly the previews that changed
+        if self.tabview.get() != 'Inputs':
             return
-        
-        # Read inputs (already validated elsewhere) — just retrieve values
-        Sb = float(self.Sb.get())
-        trise = int(float(self.trise_hr.get()) * hour)
-        tset = int(float(self.tset_hr.get()) * hour)
-        Ta_mean = float(self.Ta_mean_C.get()) + 273.15
-        Ta_amp = float(self.Ta_amp_C.get())
-        Ldown = float(self.Ldown.get())
-
-        # plot over a 24 h window with a 10-min timestep
-        tmax = 24 * hour
-        dt = 600.0
-        t = np.arange(0, tmax + dt, dt)
-        TaK, S0 = diurnal_forcing(t, Ta_mean=Ta_mean, Ta_amp=Ta_amp, Sb=Sb, trise=trise, tset=tset)
-
-        TaC = TaK - 273.15
-
-        # Ta figure
-        self.ax_Ta.clear()
-        self.ax_Ta.plot(t / hour, TaC, color='tab:blue', label='Ta (°C)')
-        self.ax_Ta.set_xlabel('Time (h)')
-        self.ax_Ta.set_ylabel('Air temp (°C)')
-        self.ax_Ta.set_xlim(0, 24)
-        self.ax_Ta.grid(True, linestyle=':', alpha=0.5)
-        self.ax_Ta.legend(loc='upper right')
-        # avoid tight_layout clipping the right spine
-        self.fig_Ta.subplots_adjust(right=0.98)
-        # use tight_layout but reserve a small right margin so legends/spines are not clipped
-        self.fig_Ta.tight_layout(rect=(0, 0, 0.98, 1))
-        self.canvas_Ta.draw()
-
-        # Kdown + Ldown figure
-        self.ax_K.clear()
-        self.ax_K.plot(t / hour, S0, color='tab:orange', label='Kdown (W/m2)')
-        self.ax_K.plot(t / hour, np.full_like(t, Ldown), color='tab:purple', linestyle='--', label='Ldown (W/m2)')
-        self.ax_K.set_xlabel('Time (h)')
-        self.ax_K.set_ylabel('Flux (W/m2)')
-        self.ax_K.set_xlim(0, 24)
-        self.ax_K.grid(True, linestyle=':', alpha=0.5)
-        self.ax_K.legend(loc='upper right')
-        self.fig_K.subplots_adjust(right=0.98)
-        # reserve right margin for legend
-        self.fig_K.tight_layout(rect=(0, 0, 0.98, 1))
-        self.canvas_K.draw()
+
+        # Read the raw entry text: the preview follows typing, before
+        # focus-out validation has stored anything in self._params
+        try:
+            Sb = float(self.Sb.get())
+            trise = int(float(self.trise_hr.get()) * hour)
+            tset = int(float(self.tset_hr.get()) * hour)
+            Ta_mean = float(self.Ta_mean_C.get()) + 273.15
+            Ta_amp = float(self.Ta_amp_C.get())
+            Ldown = float(self.Ldown.get())
+        except ValueError:
+            # an entry is mid-edit (e.g. empty or '-'); keep the last preview
+            return
+        # traces also fire for edits that parse to the same values; each
+        # axes is only touched when one of its own inputs changed
+        keys = {self.ax_Ta: (trise, tset, Ta_mean, Ta_amp),
+                self.ax_K: (Sb, trise, tset, Ldown)}
+        stale = [ax for ax, key in keys.items() if self._preview_key.get(ax) != key]
+        if not stale:
+            return
+        self._preview_key.update(keys)
+
+        # evaluate the forcing on the cached preview grid in one vectorised call
+        t = self._preview_t
+        TaK, S0 = diurnal_forcing(t, Ta_mean=Ta_mean, Ta_amp=Ta_amp, Sb=Sb, trise=trise, tset=tset,
+                                  out=self._preview_buf)
+
+        # Ta axes: update the persistent line (converted in place in the
+        # scratch buffer); y is rescaled with the other stale axes below
+        if self.ax_Ta in stale:
+            TaK -= 273.15
+            self.line_Ta.set_ydata(TaK)
+
+        # Kdown + Ldown axes
+        if self.ax_K in stale:
+            self.line_K.set_ydata(S0)
+            self.line_Ldown.set_ydata([Ldown, Ldown])
+
+        self._refresh_preview(stale)
+
+    def _refresh_preview(self, axes):
+        """Rescale the given preview axes and redraw them as cheaply as possible.
+
+        If autoscaling leaves all their y-limits unchanged only the lines are
+        blitted over the cached background of each axes; otherwise ticks and
+        labels change too, so one full (idle) draw of the preview canvas
+        covers every axes at once. The limits snap to tick values, so most
+        edits stay on the blit path.
+        """
+        canvas = self.canvas_preview
+        full = False
+        with mpl.rc_context({'axes.autolimit_mode': 'round_numbers'}):
+            for ax in axes:
+                ylim = ax.get_ylim()
+                ax.relim()
+                ax.autoscale_view()
+                full = full or ax not in self._preview_bg or ax.get_ylim() != ylim
+        if full:
+            canvas.draw_idle()
+            return
+        for ax in axes:
+            canvas.restore_region(self._preview_bg[ax])
+            for line in self._preview_blit[ax]:
+                ax.draw_artist(line)
+            canvas.blit(ax.bbox)
+
+    def _on_preview_draw(self, event=None):
+        """Capture the preview axes backgrounds after a full draw and draw their lines."""
+        canvas = self.canvas_preview
+        for ax, lines in self._preview_blit.items():
+            self._preview_bg[ax] = canvas.copy_from_bbox(ax.bbox)
+            for line in lines:
+                ax.draw_artist(line)
 
     # --- preview auto-update helpers ---
-    def _schedule_preview_update(self, delay_ms: int = 200):
-        """Debounced schedule for preview updates (cancels previous scheduled call)."""
-        pid = getattr(self, '_preview_after_id', None)
+    def _schedule_preview_update(self, delay_ms: int = 150):
+        """Schedule a preview update unless one is already pending.
+
+        Changes arriving while an update is pending are picked up by it, so
+        a burst of trace events costs one ``after`` call and no cancels.
+        """
+        if self._preview_after_id is not None:
+            return
+        self._preview_after_id = self.after(delay_ms, self._do_preview_update)
+
+    def _on_preview_input(self, *args):
+        """Variable-trace callback shared by all preview inputs."""
+        self._schedule_preview_update()
+
+    def _do_preview_update(self):
+        """Run a scheduled preview update.
+
+        While a simulation is running the update is pushed back instead, so
+        a burst of edits still ends in exactly one redraw afterwards.
+        """
+        self._preview_after_id = None
+        if self._running:
+            self._schedule_preview_update()
+            return
+        # don't replot half-typed values; the focus-out handler draws the
+        # final value once editing is done
+        if self._editing_entry():
+            return
+        self.update_preview()
+
+    def _editing_entry(self) -> bool:
+        """Return True if keyboard focus is in one of the parameter entries."""
+        try:
+            w = self.focus_get()
+        except KeyError:
+            # focus_get can fail while a Tk popup menu holds the focus
+            return False
+        # CTkEntry wraps a plain tk Entry, which is what actually takes focus
+        return w is not None and (w in self._entry_keys or getattr(w, 'master', None) in self._entry_keys)
+
+    def _on_entry_focus_out(self, key: str):
+        """Validate an entry when it loses focus and preview the new value."""
+        self._validate_and_store(key)
+        pid = self._preview_after_id
         if pid is not None:
             self.after_cancel(pid)
-        self._preview_after_id = self.after(delay_ms, self.update_preview)
+            self._preview_after_id = None
+        if self._running:
+            self._schedule_preview_update()
+        else:
+            self.update_preview()
 
     def _install_preview_traces(self):
-        """Install traces on input variables so changing them auto-updates the preview."""
-        vars_to_trace = [
-            getattr(self, 'Sb', None), getattr(self, 'trise_hr', None), getattr(self, 'tset_hr', None),
-            getattr(self, 'Ldown', None), getattr(self, 'hcoef', None), getattr(self, 'Ta_mean_C', None),
-            getattr(self, 'Ta_amp_C', None), getattr(self, 'beta_var', None),
-            getattr(self, 'thickA', None), getattr(self, 'thickB', None),
-            getattr(self, 'matA', None), getattr(self, 'matB', None), getattr(self, 'compare_var', None)
-        ]
-        for v in vars_to_trace:
-            if v is None:
-                continue
-            # tkinter variables support trace_add in modern Python
-            v.trace_add('write', lambda *a, _=v: self._schedule_preview_update())
+        """Install traces on input variables so changing them auto-updates the preview.
+
+        Only the forcing inputs the previews plot are traced; materials,
+        thickness, h, beta and compare do not change them.
+        """
+        for v in (self.Sb, self.trise_hr, self.tset_hr, self.Ldown, self.Ta_mean_C, self.Ta_amp_C):
+            v.trace_add('write', self._on_preview_input)
 
     # --- generic validators -------------------------------------------------
     def _var_for_key(self, key: str):
         """Return the tkinter Variable associated with a validation key.
 
-        This maps logical parameter names (keys used in validators) to the
-        tkinter variable attributes stored on the App instance.
+        Logical parameter names (keys used in validators) are resolved via
+        ``self._key_to_var``, built once the input variables exist.
         """
-        mapping = {
-            'Sb': 'Sb',
-            'trise': 'trise_hr',
-            'tset': 'tset_hr',
-            'Ldown': 'Ldown',
-            'h': 'hcoef',
-            'Ta_mean': 'Ta_mean_C',
-            'Ta_amp': 'Ta_amp_C',
-            'beta': 'beta_var',
-            'thickness_A': 'thickA',
-            'thickness_B': 'thickB',
-        }
-        attr = mapping.get(key)
-        if not attr:
-            return None
-        return getattr(self, attr, None)
+        return self._key_to_var.get(key)
 
     def _validate_nonneg(self, key: str):
         """Validate a non-negative numeric field (>= 0). Returns (ok, value)."""
@@ -846,6 +1203,37 @@ class App(ctk.CTk):
             return False, f"Invalid {key} â€” enter a numeric value."
         return True, float(v)
 
+    # streamlined parsers: raise on invalid; _validate_and_store handles errors centrally
+    def _parse_var(self, k: str) -> float:
+        var = self._var_for_key(k)
+        if var is None:
+            raise ValueError(f"Internal error: missing UI variable for {k}.")
+        return float(var.get())
+
+    def _parse_nonneg(self, k: str) -> float:
+        v = self._parse_var(k)
+        if v < 0:
+            raise ValueError("must be a non-negative number.")
+        return v
+
+    def _parse_positive(self, k: str) -> float:
+        v = self._parse_var(k)
+        if v <= 0:
+            raise ValueError("must be a positive number.")
+        return v
+
+    def _parse_hours(self, k: str) -> int:
+        vh = self._parse_var(k)
+        if not (0.0 <= vh <= 24.0):
+            raise ValueError("enter hours between 0 and 24.")
+        return int(vh * hour)
+
+    def _parse_tempC_to_K(self, k: str) -> float:
+        return self._parse_var(k) + 273.15
+
+    def _parse_any(self, k: str) -> float:
+        return self._parse_var(k)
+
     def _validate_and_store(self, key: Optional[str] = None, event: Optional[object] = None):
         """Validate inputs and persist canonical values.
 
@@ -854,108 +1242,48 @@ class App(ctk.CTk):
         - On success: stores canonical values in ``self._params`` and returns
           ``True``.
         """
-        # helper to safely set a doublevar (and clamp/convert)
-        def set_doublevar(var, val):
-            var.set(val)
-
-        # helper to map validation keys to entry widgets and readable names
-        key_map = {
-            'Sb': (self.entry_Sb, 'Peak shortwave (W/m2)'),
-            'trise': (self.entry_trise, 'Sunrise time (h)'),
-            'tset': (self.entry_tset, 'Sunset time (h)'),
-            'Ldown': (self.entry_Ldown, 'Incoming longwave (W/m2)'),
-            'h': (self.entry_hcoef, 'Heat transfer coeff (W/m2K)'),
-            'Ta_mean': (self.entry_Ta_mean, 'Air mean temp (°C)'),
-            'Ta_amp': (self.entry_Ta_amp, 'Air temperature amp (°C)'),
-            'beta': (self.entry_beta, 'Bowen ratio (-)'),
-            'thickness_A': (self.entry_thickA, 'Thickness A (m)'),
-            'thickness_B': (self.entry_thickB, 'Thickness B (m)'),
-        }
-
-        def focus_and_select(entry_widget):
-            entry_widget.focus_set()
-            entry_widget.select_range(0, 'end')
-
-        def show_fix_message(entry_widget, label, msg):
-            # show modal dialog and return focus to the offending widget
-            messagebox.showerror('Invalid input', msg)
-            # restore focus to the widget after the dialog closes
-            self.after(1, lambda: focus_and_select(entry_widget))
-
-        # streamlined validators: raise on invalid; _validate_and_store handles errors centrally
-        def _parse_nonneg(k: str) -> float:
-            var = self._var_for_key(k)
-            if var is None:
-                raise ValueError(f"Internal error: missing UI variable for {k}.")
-            v = float(var.get())
-            if v < 0:
-                raise ValueError("must be a non-negative number.")
-            return float(v)
-
-        def _parse_positive(k: str) -> float:
-            var = self._var_for_key(k)
-            if var is None:
-                raise ValueError(f"Internal error: missing UI variable for {k}.")
-            v = float(var.get())
-            if v <= 0:
-                raise ValueError("must be a positive number.")
-            return float(v)
-
-        def _parse_hours(k: str) -> int:
-            var = self._var_for_key(k)
-            if var is None:
-                raise ValueError(f"Internal error: missing UI variable for {k}.")
-            vh = float(var.get())
-            if not (0.0 <= vh <= 24.0):
-                raise ValueError("enter hours between 0 and 24.")
-            return int(vh * hour)
-
-        def _parse_tempC_to_K(k: str) -> float:
-            var = self._var_for_key(k)
-            if var is None:
-                raise ValueError(f"Internal error: missing UI variable for {k}.")
-            v_c = float(var.get())
-            return float(v_c) + 273.15
-
-        def _parse_any(k: str) -> float:
-            var = self._var_for_key(k)
-            if var is None:
-                raise ValueError(f"Internal error: missing UI variable for {k}.")
-            return float(var.get())
-
-        validators = {
-            'Sb': lambda: _parse_nonneg('Sb'),
-            'trise': lambda: _parse_hours('trise'),
-            'tset': lambda: _parse_hours('tset'),
-            'Ldown': lambda: _parse_nonneg('Ldown'),
-            'h': lambda: _parse_nonneg('h'),
-            'Ta_mean': lambda: _parse_tempC_to_K('Ta_mean'),
-            'Ta_amp': lambda: _parse_nonneg('Ta_amp'),
-            'beta': lambda: _parse_any('beta'),
-            'thickness_A': lambda: _parse_positive('thickness_A'),
-            'thickness_B': lambda: _parse_positive('thickness_B'),
-        }
-
         # if no specific key given, validate all and stop at first error
-        keys_to_check = [key] if key else list(validators.keys())
+        keys_to_check = [key] if key else list(self._VALIDATORS)
+        parsed = {}
         for kk in keys_to_check:
-            validator = validators.get(kk)
-            if validator is None:
+            spec = self._VALIDATORS.get(kk)
+            if spec is None:
                 continue
             try:
-                res = validator()
+                parsed[kk] = getattr(self, spec[0])(kk)
             except Exception as exc:
-                entry_widget, label = key_map.get(kk, (None, kk))
-                msg = f"{label}: {exc}\n\nPlease correct the value."
-                if entry_widget is not None:
-                    show_fix_message(entry_widget, label, msg)
-                else:
-                    messagebox.showerror('Invalid input', msg)
+                self._report_invalid(kk, exc)
                 return False
-            # on success, store canonical value
-            self._params[kk] = res
+        # sunrise before sunset is checked once per full validation (before
+        # each run), on both freshly parsed times, so the two entries can be
+        # edited in any order; the forcing divides by tset - trise
+        if key is None and parsed['trise'] >= parsed['tset']:
+            self._report_invalid('tset', 'must be after sunrise.')
+            return False
+        # on success, store canonical values
+        self._params.update(parsed)
         return True
 
+    def _report_invalid(self, k: str, reason):
+        """Show why the value for validation key ``k`` was rejected."""
+        _parser, entry_attr, label = self._VALIDATORS[k]
+        msg = f"{label}: {reason}\n\nPlease correct the value."
+        entry_widget = getattr(self, entry_attr, None)
+        if entry_widget is not None:
+            self._show_fix_message(entry_widget, msg)
+        else:
+            messagebox.showerror('Invalid input', msg)
+
+    def _show_fix_message(self, entry_widget, msg: str):
+        """Show a modal error and return focus to the offending entry."""
+        messagebox.showerror('Invalid input', msg)
+
+        def focus_and_select():
+            entry_widget.focus_set()
+            entry_widget.select_range(0, 'end')
+        # restore focus to the widget after the dialog closes
+        self.after(1, focus_and_select)
+
     # --- simple tooltip implementation (CTk-styled when possible, fallback to Tk)
     def _schedule_show_material_tooltip(self, widget, var, delay=300):
         """Debounced schedule for the material tooltip.
@@ -964,18 +1292,15 @@ class App(ctk.CTk):
         shows selected ``Material`` fields read via ``load_material``.
         """
         # if this is Material B's widget and compare is disabled, don't show
-        if widget is getattr(self, 'opt_matB', None) and not bool(getattr(self, 'compare_var', ctk.BooleanVar(value=False)).get()):
+        if widget is self.opt_matB and not bool(self.compare_var.get()):
             return
         # cancel any existing schedule
-        pid = getattr(self, '_tooltip_after_id', None)
+        pid = self._tooltip_after_id
         if pid is not None:
             self.after_cancel(pid)
- 
-        # schedule new show
+
+        # schedule new show; the tooltip appears only after the hover delay
         self._tooltip_after_id = self.after(delay, lambda: self._show_material_tooltip(widget, var))
- 
-        # immediate fallback: show now
-        self._show_material_tooltip(widget, var)
 
     def _show_material_tooltip(self, widget, var):
         """Show a small tooltip with material properties.
@@ -985,12 +1310,9 @@ class App(ctk.CTk):
         placed to the left of the combobox.
         """
         self._tooltip_after_id = None
-        tw = getattr(self, '_tooltip_win', None)
-        if tw is not None:
-            tw.destroy()
-        self._tooltip_win = None
+        tw = self._tooltip_win
 
-        if widget is getattr(self, 'opt_matB', None) and not bool(getattr(self, 'compare_var', ctk.BooleanVar(value=False)).get()):
+        if widget is self.opt_matB and not bool(self.compare_var.get()):
             return
         mat_key = var.get()
         if not mat_key:
@@ -1008,19 +1330,17 @@ class App(ctk.CTk):
             lines.append(f"albedo={mat.albedo:.3g}  emissivity={mat.emissivity:.3g}  evap={bool(getattr(mat,'evaporation', False))}")
         text = '\n'.join(lines)
 
-        tw = tk.Toplevel(self)
-        tw.wm_overrideredirect(True)
-        tw.wm_attributes('-topmost', True)
-        ctk.CTkLabel(tw, text=text, justify='left', padx=8, pady=6).pack()
+        self._tooltip_label.configure(text=text)
         # Compute placement: for Material B, place tooltip to the LEFT of the combo
         # so it remains within the app window; otherwise place it to the right.
+        # The window may be withdrawn, so use its requested size.
         tw.update_idletasks()
         wx = widget.winfo_rootx(); wy = widget.winfo_rooty(); ww = widget.winfo_width(); wh = widget.winfo_height()
-        tw_w = tw.winfo_width(); tw_h = tw.winfo_height()
+        tw_w = tw.winfo_reqwidth(); tw_h = tw.winfo_reqheight()
         # Root window bounds for clamping
         rx = self.winfo_rootx(); ry = self.winfo_rooty(); rw = self.winfo_width(); rh = self.winfo_height()
         # Decide side based on whether this is the Material B widget
-        is_matB = (widget is getattr(self, 'opt_matB', None))
+        is_matB = (widget is self.opt_matB)
         if is_matB:
             x = wx - tw_w - 8
         else:
@@ -1029,120 +1349,90 @@ class App(ctk.CTk):
         # Clamp within the app window
         x = max(rx + 2, min(x, rx + rw - tw_w - 2))
         y = max(ry + 2, min(y, ry + rh - tw_h - 2))
-        tw.geometry(f'+{int(x)}+{int(y)}')
-        tw.bind('<Leave>', lambda e: self._hide_material_tooltip())
-        tw.bind('<Enter>', lambda e: None)
-        self._tooltip_win = tw
+        tw.wm_geometry(f'+{int(x)}+{int(y)}')
+        tw.deiconify()
         self._tooltip_origin = widget
-        self.bind('<Motion>', self._tooltip_motion_handler)
+        # screen rectangles (x, y, w, h) of the tooltip and its origin, so the
+        # leave handler needs no geometry queries while the tooltip is up
+        self._tooltip_rects = ((int(x), int(y), tw_w, tw_h), (wx, wy, ww, wh))
 
     def _hide_material_tooltip(self):
-        """Hide/destroy any visible tooltip and cancel scheduled shows."""
-        pid = getattr(self, '_tooltip_after_id', None)
+        """Withdraw the tooltip window and cancel scheduled shows."""
+        pid = self._tooltip_after_id
         if pid is not None:
             self.after_cancel(pid)
             self._tooltip_after_id = None
-        tw = getattr(self, '_tooltip_win', None)
-        if tw is not None:
-            tw.destroy()
-        # clear origin and unbind motion handler
+        tw = self._tooltip_win
+        if tw is not None and self._tooltip_origin is not None:
+            tw.withdraw()
         self._tooltip_origin = None
-        self.unbind('<Motion>')
-        self._tooltip_win = None
-
-    def _tooltip_motion_handler(self, event=None):
-        """Hide tooltip when mouse leaves both the origin widget and tooltip."""
-        tw = getattr(self, '_tooltip_win', None)
-        if tw is None:
-            self.unbind('<Motion>')
-            return
-        origin = getattr(self, '_tooltip_origin', None)
-        px = self.winfo_pointerx()
-        py = self.winfo_pointery()
-        # check tooltip geometry
-        tx = tw.winfo_rootx(); ty = tw.winfo_rooty(); tw_w = tw.winfo_width(); tw_h = tw.winfo_height()
-        if tx <= px <= tx + tw_w and ty <= py <= ty + tw_h:
-            return
-        # check origin geometry
-        if origin is not None:
-            ox = origin.winfo_rootx(); oy = origin.winfo_rooty(); ow = origin.winfo_width(); oh = origin.winfo_height()
-            if ox <= px <= ox + ow and oy <= py <= oy + oh:
-                return
-        # pointer is outside both -> hide
+
+    def _on_tooltip_leave(self, event):
+        """Hide tooltip when mouse leaves both the origin widget and tooltip.
+
+        Bound to ``<Leave>`` on the option menus and the tooltip window. CTk
+        widgets are composites, so a Leave also fires when moving between
+        their internal parts; the pointer position carried by the event is
+        tested against the rectangles cached by ``_show_material_tooltip``
+        and the tooltip stays up while it is inside either of them.
+        """
+        if self._tooltip_origin is not None:
+            px, py = event.x_root, event.y_root
+            for x, y, w, h in self._tooltip_rects:
+                if x <= px < x + w and y <= py < y + h:
+                    return
+        # pointer is outside both (or the tooltip is still pending) -> hide
         self._hide_material_tooltip()
 
+    def _new_figure(self, figsize, **kwargs):
+        """Return a Figure for embedding, on the inputs frame background.
+
+        The background is resolved from the CTk theme once in
+        ``_build_inputs_tab``; every tab's figure shares it.
+        """
+        return Figure(figsize=figsize, facecolor=self._input_frame_bg, **kwargs)
+
     def _mpl_color_from_ctk(self, c):
         """Convert a CTk color (hex string or tuple) to an MPL-compatible color.
 
         CTk may return colors as HEX strings like '#rrggbb' or as tuples.
-        Handle common cases and fall back to the input unchanged.
+        Theme colors are ``(light, dark)`` name pairs; the entry for the
+        current appearance mode is used. Tk color names go through the
+        memoized ``_resolve_tk_color``; everything else is handled by the
+        cached, Tk-independent ``_ctk_color_to_mpl``. Both caches hold
+        mode-independent conversions, so a mode switch needs no clearing.
         """
-        if c is None:
-            return None
-        # if it's a string, try to convert Tk-style color names (e.g. 'gray86')
-        # to an RGB tuple Matplotlib accepts. If it's a hex string, return it
-        # unchanged. Fall back to returning the original input on failure.
-        if isinstance(c, str):
-            # hex strings are already acceptable for Matplotlib
-            if c.startswith('#'):
-                return c
-            # resolve the color via the underlying Tk color parser (0..65535)
-            rgb16 = self.winfo_rgb(c)
-            r = rgb16[0] / 65535.0
-            g = rgb16[1] / 65535.0
-            b = rgb16[2] / 65535.0
-            return (r, g, b)
-        # tuple-like: try to coerce to an RGB or RGBA tuple of floats in 0..1
-        if isinstance(c, tuple) and all(isinstance(x, (int, float)) for x in c):
-            vals = [float(x) / 255.0 if (isinstance(x, (int,)) and x > 1) else float(x) for x in c]
-            # ensure length 3 or 4
-            if len(vals) >= 3:
-                if len(vals) == 3:
-                    return (vals[0], vals[1], vals[2])
-                else:
-                    # keep first 4 components as RGBA
-                    return (vals[0], vals[1], vals[2], vals[3])
-            # fallthrough
-        return None
+        key = tuple(c) if isinstance(c, list) else c
+        if isinstance(key, tuple) and len(key) == 2 and all(isinstance(x, str) for x in key):
+            key = key[ctk.get_appearance_mode() == 'Dark']
+        if isinstance(key, str) and not key.startswith('#'):
+            return self._resolve_tk_color(key)
+        return _ctk_color_to_mpl(key)
 
-    def _mat_allows_evap(self, mat: Optional[object]) -> bool:
-        """Return True if the given material (dict-like or object) enables evaporation.
+    def _resolve_tk_color(self, name: str):
+        """Resolve a Tk color name (e.g. 'gray86') to an RGB tuple in 0..1.
 
-        This helper accepts either a mapping (with .get) or an object with an
-        attribute `evaporation` so it's robust to the material representation
-        returned by load_material.
+        Needs the Tk color parser, so results are memoized per instance.
         """
-        if mat is None:
-            return False
-        # prefer Mapping checks so static checkers know .get exists
-        if isinstance(mat, Mapping):
-            return bool(mat.get('evaporation', False))
-        return bool(getattr(mat, 'evaporation', False))
+        try:
+            return self._tk_color_cache[name]
+        except KeyError:
+            pass
+        # resolve the color via the underlying Tk color parser (0..65535)
+        rgb16 = self.winfo_rgb(name)
+        res = self._tk_color_cache[name] = (rgb16[0] / 65535.0, rgb16[1] / 65535.0, rgb16[2] / 65535.0)
+        return res
+
+    def _apply_compare_state(self):
+        """Enable or gray out the Material B controls to match the Compare checkbox."""
+        state, entry_color, lbl_color = self._matB_style[bool(self.compare_var.get())]
+        self.opt_matB.configure(state=state)
+        self.entry_thickB.configure(state=state, text_color=entry_color)
+        self.lbl_thickB.configure(text_color=lbl_color)
 
     def _on_compare_toggle(self):
         """Enable/disable Material B controls when the Compare checkbox changes."""
-        enabled = bool(self.compare_var.get())
-        state = 'normal' if enabled else 'disabled'
-        if getattr(self, 'opt_matB', None) is not None:
-            self.opt_matB.configure(state=state)
-        if getattr(self, 'entry_thickB', None) is not None:
-            self.entry_thickB.configure(state=state)
-        # visually indicate Material B entry and label color when compare toggles
-        if not enabled:
-            # set both the entry text and the label to gray when disabled
-            self.entry_thickB.configure(text_color='gray')
-            self.lbl_thickB.configure(text_color='gray')
-        else:
-            # restore label and entry to their saved defaults
-            if getattr(self, '_entry_thickB_text_color_default', None) is not None:
-                self.entry_thickB.configure(text_color=self._entry_thickB_text_color_default)
-            else:
-                self.entry_thickB.configure(text_color=None)
-            if getattr(self, '_lbl_thickB_color_default', None) is not None:
-                self.lbl_thickB.configure(text_color=self._lbl_thickB_color_default)
-            else:
-                self.lbl_thickB.configure(text_color=None)
-
+        self._apply_compare_state()
         # update animation background/layout for new compare state
         self.draw_anim_static()
 
@@ -1165,122 +1455,166 @@ class App(ctk.CTk):
         """
         # draw a simple background showing material depths
         # guard: avoid drawing if app is closed
-        if getattr(self, '_closed', False):
-            return
-        # require that self.ax_anim exists
-        if not getattr(self, 'ax_anim', None):
+        if self._closed:
             return
-        if hasattr(self, 'winfo_exists') and not self.winfo_exists():
+        if not self.winfo_exists():
             return
         ax = self.ax_anim
         ax.clear()
+        # the profile lines and SEB arrow pools were removed by ax.clear(),
+        # and the cached background no longer matches the axes
+        self._anim_lines = {}
+        self._anim_seb = {}
+        self._anim_bg = None
 
         # determine thickness to show; prefer max of A and B when comparing
-        thickA = float(self.thickA.get())
-        thickB = float(self.thickB.get()) if getattr(self, 'compare_var', None) and bool(self.compare_var.get()) else 0.0
-        thick = max(thickA, thickB, 0.1)
+        comparing = bool(self.compare_var.get())
+        thickA = self._params['thickness_A']
+        thickB = self._params['thickness_B'] if comparing else 0.0
+        # the limits stay fixed during playback; the SEB arrows read them
+        # from here instead of querying the axes every frame
+        self._anim_lims = self._draw_profile_background(ax, thickA, thickB, comparing)
 
-        # y-limits per request: [-thickness, thickness/2]
-        ymin = -thick
-        ymax = thick / 2.0
-        ax.set_ylim(ymin, ymax)
+        # initial title (time will be updated each frame) — show time in axes title
+        ax.set_title('Time: -- h')
 
-        # X limits: if we have anim_data, set to full range of profile temps
-        try:
-            anim = getattr(self, 'anim_data', None)
-            if anim and anim.get('A') is not None:
-                outA = anim.get('A')
-                tps = np.asarray(outA.get('T_profiles', [])) - 273.15
-                xmin = float(np.nanmin(tps)) if tps.size else -10.0
-                xmax = float(np.nanmax(tps)) if tps.size else 40.0
-                # include B if present
-                if anim.get('B') is not None and bool(self.compare_var.get()):
-                    outB = anim.get('B')
-                    tpsb = np.asarray(outB.get('T_profiles', [])) - 273.15
-                    if tpsb.size:
-                        xmin = min(xmin, float(np.nanmin(tpsb)))
-                        xmax = max(xmax, float(np.nanmax(tpsb)))
-                # pad slightly and ensure left limit shows cold temps (at least -10°C)
-                span = max(0.5, xmax - xmin)
-                xmin_pad = xmin - 0.05 * span
-                xmin_pad = min(xmin_pad, -10.0)
-                ax.set_xlim(xmin_pad, xmax + 0.05 * span)
-            else:
-                ax.set_xlim(0, 30)
-        except Exception:
-            try:
-                ax.set_xlim(0, 30)
-            except Exception:
-                pass
+        # draw initial temperature profile (time index 0) if available so the
+        # user sees the initial condition immediately when the screen loads.
+        # The profile lines are animated artists: they are excluded from the
+        # cached background and updated in place by ``animate_step``.
+        anim = self.anim_data
+        if anim and anim.get('A') is not None:
+            z = anim['A'].get('z')
+            if anim.get('A_TC') is not None and z is not None:
+                self._anim_lines['A'], = ax.plot(anim['A_TC'][0], z, '-r', alpha=0.9, zorder=2, label='A', animated=True)
+            # plot B initial if present and comparing
+            if anim.get('B') is not None and comparing:
+                zB = anim['B'].get('z')
+                if anim.get('B_TC') is not None and zB is not None:
+                    self._anim_lines['B'], = ax.plot(anim['B_TC'][0], zB, '-b', alpha=0.9, zorder=2, label='B', animated=True)
+            ax.legend(loc='lower left', fontsize='small')
+        # one pool of SEB arrow/label artists per shown material; they start
+        # hidden and animate_step only moves and relabels them
+        for key in self._anim_lines:
+            self._anim_seb[key] = self._make_seb_artists(ax, animated=True)
+        ax.title.set_animated(True)
+        self._anim_artists = list(self._anim_lines.values()) + [ax.title]
+        for pool in self._anim_seb.values():
+            self._anim_artists += self._seb_pool_artists(pool)
+        # keep surface at top (invert so 0 is near the top)
+        # keep normal y-axis orientation so depth increases downward
+        # the full draw fires ``draw_event`` which re-captures the background;
+        # until then ``_blit_anim`` falls back to requesting an idle draw
+        self.canvas_anim.draw_idle()
+
+    def _draw_profile_background(self, ax, thickA: float, thickB: float, comparing: bool):
+        """Set the profile axes limits and draw the static soil layout.
+
+        Shared by the Animation and Temp & SEB views. Returns the limits as
+        ``((x0, x1), (y0, y1))``.
+        """
+        # y-limits per request: [-thickness, thickness/2] for the thicker layer
+        thick = max(thickA, thickB, 0.1)
+        ylim = (-thick, thick / 2.0)
+        # X limits: full range of profile temps of the run
+        xlim = self._profile_xlim(comparing)
+        ax.set_xlim(*xlim)
+        ax.set_ylim(*ylim)
 
         # soil patch: light grey behind the temperature profile from surface (0) down to -thick
-        try:
-            ax.axhspan(ymin=-thick, ymax=0.0, facecolor='lightgrey', zorder=0, alpha=0.5)
-        except Exception:
-            pass
+        ax.axhspan(ymin=-thick, ymax=0.0, facecolor='lightgrey', zorder=0, alpha=0.5)
 
         # solid surface line at z=0
         ax.axhline(y=0.0, color='k', linewidth=1.0, zorder=3)
 
-        # if comparing and thicknesses differ, draw a dash-dot line at the bottom of
-        # the thinner layer to denote its base
-        if self.compare_var.get():
-            thickA = float(self.thickA.get())
-            thickB = float(self.thickB.get())
-            # choose the larger for the filled patch (already used); show a dash-dot
-            # at the bottom of the smaller (if different by more than eps)
-            if abs(thickA - thickB) > 1e-6:
-                other_thick = min(thickA, thickB)
-                ax.axhline(y=-other_thick, color='k', linestyle='-.', linewidth=1.0, zorder=3)
+        # if comparing and thicknesses differ, draw a dash-dot line at the
+        # bottom of the thinner layer to denote its base
+        if comparing and abs(thickA - thickB) > 1e-6:
+            other_thick = min(thickA, thickB)
+            ax.axhline(y=-other_thick, color='k', linestyle='-.', linewidth=1.0, zorder=3)
 
+        # keep normal y-axis orientation so depth increases downward
         ax.set_xlabel('Temperature (°C)')
         ax.set_ylabel('Depth (m)')
-        # initial title (time will be updated each frame) — show time in axes title
-        try:
-            ax.set_title('Time: -- h')
-        except Exception:
-            pass
+        return xlim, ylim
 
-        # draw initial temperature profile (time index 0) if available so the
-        # user sees the initial condition immediately when the screen loads.
-        try:
-            anim = getattr(self, 'anim_data', None)
-            if anim and anim.get('A') is not None:
-                outA = anim.get('A')
-                if 'T_profiles' in outA and len(outA['T_profiles']):
-                    z = outA.get('z', None)
-                    if z is not None:
-                        try:
-                            ax.plot(outA['T_profiles'][0] - 273.15, z, '-r', alpha=0.9, zorder=2, label='A')
-                        except Exception:
-                            pass
-                # plot B initial if present and comparing
-                if anim.get('B') is not None and bool(getattr(self, 'compare_var', ctk.BooleanVar(value=False)).get()):
-                    outB = anim.get('B')
-                    if 'T_profiles' in outB and len(outB['T_profiles']):
-                        zB = outB.get('z', None)
-                        if zB is not None:
-                            try:
-                                ax.plot(outB['T_profiles'][0] - 273.15, zB, '-b', alpha=0.9, zorder=2, label='B')
-                            except Exception:
-                                pass
-                try:
-                    ax.legend(loc='lower left', fontsize='small')
-                except Exception:
-                    pass
-        except Exception:
-            pass
-        # keep surface at top (invert so 0 is near the top)
-        # keep normal y-axis orientation so depth increases downward
-        try:
-            self.canvas_anim.draw()
-        except Exception:
-            pass
+    def _profile_xlim(self, comparing: bool):
+        """Return temperature axis limits covering every profile of the run.
+
+        Uses the per-run ranges cached by ``_apply_sim_result`` (including B
+        when comparing), padded by 5% and extended to show at least -10°C.
+        Returns ``(0, 30)`` when no run is stored.
+        """
+        anim = self.anim_data
+        if not anim or anim.get('A') is None:
+            return 0.0, 30.0
+        xmin, xmax = anim.get('A_Trange') or (-10.0, 40.0)
+        # include B if present
+        rangeB = anim.get('B_Trange')
+        if rangeB is not None and comparing:
+            xmin = min(xmin, rangeB[0])
+            xmax = max(xmax, rangeB[1])
+        if not (np.isfinite(xmin) and np.isfinite(xmax)):
+            return 0.0, 30.0
+        # pad slightly and ensure left limit shows cold temps (at least -10°C)
+        span = max(0.5, xmax - xmin)
+        xmin_pad = xmin - 0.05 * span
+        xmin_pad = min(xmin_pad, -10.0)
+        return xmin_pad, xmax + 0.05 * span
+
+    def _on_anim_draw(self, event=None):
+        """Capture the static animation background after a full canvas draw.
+
+        Called for every full draw of ``canvas_anim`` (including resizes), so
+        the cached background always matches the current canvas size. The
+        animated artists are drawn on top so the full draw shows them too.
+
+        Only the band from the bottom of the axes to the top of the figure
+        is cached and blitted: it holds the profiles, the SEB arrows and
+        labels (which may reach just above the axes) and the time in the
+        axes title, while the tick labels below the axes never change.
+        """
+        fb = self.fig_anim.bbox
+        self._anim_blit_bbox = Bbox.from_extents(fb.x0, self.ax_anim.bbox.y0, fb.x1, fb.y1)
+        self._anim_bg = self.canvas_anim.copy_from_bbox(self._anim_blit_bbox)
+        self._draw_anim_artists()
+
+    def _draw_anim_artists(self):
+        """Draw the animated artists (profiles, title, SEB arrows) onto the canvas."""
+        for a in self._anim_artists:
+            self.ax_anim.draw_artist(a)
+
+    def _blit_anim(self):
+        """Restore the cached background, redraw animated artists and blit.
+
+        The blitted band spans the full figure width (rather than the axes
+        bbox) because the time is shown in the axes title, which lies
+        outside the axes area.
+        """
+        if self._anim_bg is None:
+            self.canvas_anim.draw_idle()
+            return
+        self.canvas_anim.restore_region(self._anim_bg)
+        self._draw_anim_artists()
+        self.canvas_anim.blit(self._anim_blit_bbox)
 
     # --- Animation control ---
+    def _on_speed_change(self, *args):
+        """Recompute the playback frame periods (ms) from the speed entry.
+
+        Partial or invalid text (while the user is typing) keeps the
+        previous periods.
+        """
+        try:
+            speed = max(0.001, float(self.speed_var.get() or 1.0))
+        except (tk.TclError, ValueError):
+            return
+        self._anim_period_ms = max(50.0, 500.0 / speed)
+        self._temp_period_ms = int(max(100, 1000 / speed))
+
     def toggle_animation(self):
         """Start/stop the animation playback loop."""
-        if not getattr(self, 'anim_data', None):
+        if not self.anim_data:
             messagebox.showerror('Error', 'Run a simulation first')
             return
         self.animating = not self.animating
@@ -1290,196 +1624,102 @@ class App(ctk.CTk):
             self.animate_step()
 
     def _reset_animation(self):
-        """Reset animation index to t=0 and redraw the static frame.
+        """Reset animation index to t=0 and redraw the initial frame.
 
         If animation is currently running, it will continue from t=0 on the
         next scheduled step. This method is safe to call when no anim_data is
-        present (no-op).
+        present (no-op). The static axes (soil patch, legend) are kept; only
+        the animated artists are reset and blitted.
         """
-        anim = getattr(self, 'anim_data', None)
+        anim = self.anim_data
         if anim is None:
             return
-        # reset index and redraw static background + initial profile
-        try:
-            self.anim_idx = 0
-            # update time label (if available)
-            t0 = None
-            outA = anim.get('A')
-            if outA is not None and 't' in outA and len(outA['t']):
-                t0 = float(outA['t'][0]) / float(hour)
-                try:
-                    tl = getattr(self, 'time_label', None)
-                    if tl is not None:
-                        tl.configure(text=f'Time: {t0:.2f} h')
-                except Exception:
-                    pass
-            # redraw static background which also plots initial profile when present
-            try:
-                self.draw_anim_static()
-            except Exception:
-                pass
-            # ensure the axes title reflects the reset time (draw_anim_static
-            # sets a placeholder title); update it now if we computed t0
-            try:
-                if t0 is not None and getattr(self, 'ax_anim', None) is not None:
-                    try:
-                        self.ax_anim.set_title(f'Time: {t0:.2f} h')
-                    except Exception:
-                        pass
-            except Exception:
-                pass
-        except Exception:
-            pass
+        self.anim_idx = 0
+        # rebuild the static axes only if they do not match the run yet
+        if self._anim_lines.get('A') is None:
+            self.draw_anim_static()
+        # initial profiles, no SEB arrows (as right after a static draw)
+        for key, line in self._anim_lines.items():
+            line.set_xdata(anim[key + '_TC'][0])
+        for pool in self._anim_seb.values():
+            for a in self._seb_pool_artists(pool):
+                a.set_visible(False)
+        # time label and axes title show the reset time
+        labels = anim['Tlabels']
+        if labels:
+            tl = self.time_label
+            if tl is not None:
+                tl.configure(text=labels[0])
+            self.ax_anim.set_title(labels[0])
+        self._blit_anim()
 
     def animate_step(self):
-        """One animation step: update profiles, arrows and time label, then reschedule."""
+        """One animation step: update profiles, arrows and time label, then reschedule.
+
+        The static background (soil patch, surface line, axes, legend) is
+        drawn once by ``draw_anim_static``; each step only updates the
+        animated artists and blits them over the cached background.
+        """
         # guard: stop if app closed or animation flag cleared
-        if getattr(self, '_closed', False):
+        if self._closed:
             self.animating = False
             return
         if not self.animating:
             return
-        if hasattr(self, 'winfo_exists') and not self.winfo_exists():
-            self.animating = False
-            return
-        anim_data = getattr(self, 'anim_data', None)
+        anim_data = self.anim_data
         if anim_data is None:
             # nothing to animate
             self.animating = False
             return
+        t_start = time.perf_counter()
         outA = anim_data.get('A')
         matA = anim_data.get('A_mat')
-        outB = anim_data.get('B') if self.compare_var.get() else None
-        matB = anim_data.get('B_mat') if self.compare_var.get() else None
         times = outA['t']
         i = int(self.anim_idx % len(times))
-        ax = getattr(self, 'ax_anim', None)
-        if ax is None:
-            self.animating = False
-            return
-        ax.clear()
-
-        thickA = float(self.thickA.get())
-        thickB = float(self.thickB.get()) if getattr(self, 'compare_var', None) and bool(self.compare_var.get()) else 0.0
-        thick = max(thickA, thickB, 0.1)
-
-        ymin = -thick
-        ymax = thick / 2.0
-
-        # compute x-limits from data (A and optionally B)
-        xmin, xmax = None, None
-        try:
-            tA = np.asarray(outA.get('T_profiles', [])) - 273.15
-            if tA.size:
-                xmin = float(np.nanmin(tA))
-                xmax = float(np.nanmax(tA))
-        except Exception:
-            pass
-        if outB is not None:
-            try:
-                tB = np.asarray(outB.get('T_profiles', [])) - 273.15
-                if tB.size:
-                    val_min = float(np.nanmin(tB))
-                    val_max = float(np.nanmax(tB))
-                    xmin = val_min if xmin is None else min(xmin, val_min)
-                    xmax = val_max if xmax is None else max(xmax, val_max)
-            except Exception:
-                pass
-        if xmin is None or xmax is None or not np.isfinite(xmin) or not np.isfinite(xmax):
-            xmin, xmax = -10.0, 30.0
-        # pad a little and ensure left bound at least -10°C so cold profiles are visible
-        span = max(0.5, xmax - xmin)
-        xmin = xmin - 0.05 * span
-        xmin = min(xmin, -10.0)
-        xmax = xmax + 0.05 * span
-
-        # draw soil patch first (so it's behind) and set limits
-        try:
-            ax.axhspan(ymin=-thick, ymax=0.0, facecolor='lightgrey', zorder=0, alpha=0.5)
-        except Exception:
-            pass
-
-        # solid surface line at z=0
-        ax.axhline(y=0.0, color='k', linewidth=1.0, zorder=3)
-        # dash-dot line for bottom of thinner layer when comparing
-        if self.compare_var.get():
-            thickA = float(self.thickA.get())
-            thickB = float(self.thickB.get())
-            # choose the larger for the filled patch (already used); show a dash-dot
-            # at the bottom of the smaller (if different by more than eps)
-            if abs(thickA - thickB) > 1e-6:
-                other_thick = min(thickA, thickB)
-                ax.axhline(y=-other_thick, color='k', linestyle='-.', linewidth=1.0, zorder=3)
- 
-        ax.set_xlim(xmin, xmax)
-        ax.set_ylim(ymin, ymax)
-        try:
-            ax.set_ylim(ymin, ymax)
-        except Exception:
-            pass
-
-        # plot A on top of the patch
-        try:
-            ax.plot(outA['T_profiles'][i] - 273.15, outA['z'], '-r', label='A', zorder=2)
-        except Exception:
-            pass
-        # plot B (on same axes) if present
-        if outB is not None:
-            try:
-                ax.plot(outB['T_profiles'][i] - 273.15, outB['z'], '-b', label='B', zorder=2)
-            except Exception:
-                pass
-
-        # axis labels and orientation
-        ax.set_xlabel('Temperature (°C)')
-        ax.set_ylabel('Depth (m)')
-        # keep normal y-axis orientation so depth increases downward
-        # legend (place in bottom-left corner for the animation view)
-        try:
-            ax.legend(loc='lower left', fontsize='small')
-        except Exception:
-            pass
-
-        # draw SEB arrows for A and B (A first so arrows overlay nicely)
-        try:
-            self.draw_seb_arrows(ax, outA, i, mat=matA)
-        except Exception:
-            pass
-        if outB is not None:
-            try:
-                self.draw_seb_arrows(ax, outB, i, mat=matB)
-            except Exception:
-                pass
-
-        # update time (show hours if available) and figure title
-        tval = None
-        try:
-            tval = float(times[i]) / float(hour)
-        except Exception:
-            tval = None
-        # update optional time_label widget if present (don't make this
-        # failure prevent updating the axes title)
-        if tval is not None:
-            try:
-                tl = getattr(self, 'time_label', None)
-                if tl is not None:
-                    tl.configure(text=f'Time: {tval:.2f} h')
-            except Exception:
-                pass
-            try:
-                # put time in the axes title
-                ax.set_title(f'Time: {tval:.2f} h')
-            except Exception:
-                pass
-
+        ax = self.ax_anim
+        # (re)build the static axes if they do not match the run yet
+        if self._anim_lines.get('A') is None:
+            self.draw_anim_static()
+        # the static axes are rebuilt whenever the compare checkbox changes,
+        # so a B line exists exactly when comparing (no Tcl reads per frame;
+        # _on_closing sets _closed and cancels this loop before teardown)
+        lineB = self._anim_lines.get('B')
+        outB = anim_data.get('B') if lineB is not None else None
+        matB = anim_data.get('B_mat') if lineB is not None else None
+
+        # update profile lines in place (depth axis is fixed)
+        self._anim_lines['A'].set_xdata(anim_data['A_TC'][i])
+        if lineB is not None:
+            lineB.set_xdata(anim_data['B_TC'][i])
+
+        # one guard for the whole frame render: a failing frame is skipped
+        # but does not stop the playback loop
         try:
-            self.canvas_anim.draw()
+            # move the pooled SEB arrows for A and B to this frame's fluxes
+            self.draw_seb_arrows(ax, outA, i, mat=matA, pool=self._anim_seb['A'], lims=self._anim_lims)
+            poolB = self._anim_seb.get('B')
+            if outB is not None and poolB is not None:
+                self.draw_seb_arrows(ax, outB, i, mat=matB, pool=poolB, lims=self._anim_lims)
+
+            # time in hours: in the axes title and the optional time_label
+            text = anim_data['Tlabels'][i]
+            tl = self.time_label
+            if tl is not None:
+                tl.configure(text=text)
+            ax.set_title(text)
+
+            self._blit_anim()
         except Exception:
             pass
 
-        self.anim_idx += 1
+        # keep the playback rate independent of the drawing cost: wait only
+        # for what is left of the frame period, and when a step overran one
+        # or more periods skip those frames instead of queuing late ones
+        period = self._anim_period_ms
+        elapsed = (time.perf_counter() - t_start) * 1000.0
+        self.anim_idx += 1 + int(elapsed // period)
+        delay = max(1, int(period - elapsed % period))
         # schedule next (store id so it can be cancelled)
-        delay = int(max(50, 500 / max(0.001, float(self.speed_var.get() or 1.0))))
         try:
             self._anim_after_id = self.after(delay, self.animate_step)
         except Exception:
@@ -1487,7 +1727,40 @@ class App(ctk.CTk):
             self.animating = False
 
     # draw SEB arrows helper (reusable)
-    def draw_seb_arrows(self, ax, out, idx, mat: Optional[object] = None):
+    # SEB terms shown as arrows, in display order, and their colors
+    _SEB_LABELS = ('K*', 'L*', 'G', 'H', 'E')
+    _SEB_COLORS = ('orange', 'magenta', 'saddlebrown', 'green', 'blue')
+    # arrow direction of a positive flux in axes y: down for K*, L*, G; up for H, E
+    _SEB_SIGNS = np.array([-1.0, -1.0, -1.0, 1.0, 1.0])
+
+    def _make_seb_artists(self, ax, animated: bool = False):
+        """Create a hidden pool of SEB arrows, value labels and a material label.
+
+        ``draw_seb_arrows`` positions, relabels and shows the pooled artists,
+        so the animation reuses one pool per material instead of creating
+        new annotations every frame.
+        """
+        arrows = []
+        labels = []
+        for color in self._SEB_COLORS:
+            arrows.append(ax.annotate('', xy=(0.0, 0.0), xytext=(0.0, 0.0), xycoords='axes fraction', textcoords='axes fraction',
+                                      arrowprops=dict(arrowstyle='-|>', color=color, lw=2), animated=animated, visible=False))
+            labels.append(ax.text(0.0, 0.0, '', ha='center', va='center', fontsize=9, color=color,
+                                  transform=ax.transAxes, animated=animated, visible=False))
+        name = ax.text(0.0, 0.0, '', ha='center', va='bottom', fontsize=10, fontweight='bold', animated=animated, visible=False)
+        return {'arrows': arrows, 'labels': labels, 'name': name}
+
+    @staticmethod
+    def _seb_pool_artists(pool):
+        """Return the artists of a SEB pool as a flat list."""
+        return pool['arrows'] + pool['labels'] + [pool['name']]
+
+    def draw_seb_arrows(self, ax, out, idx, mat: Optional[object] = None, animated: bool = False, pool=None, lims=None):
+        # Updates a pool made by ``_make_seb_artists`` (a new one is created
+        # on ``ax`` if ``pool`` is None) and returns its artists; pass
+        # ``animated=True`` with a new pool to keep it out of full draws.
+        # ``lims`` is an optional ``((x0, x1), (y0, y1))`` pair of known axes
+        # limits; without it they are read from ``ax``.
         # draw labeled arrows in axes-fraction coordinates so they appear at
         # a consistent location regardless of data limits. Direction mapping:
         #  - K* (net shortwave) : downward when incoming
@@ -1495,60 +1768,35 @@ class App(ctk.CTk):
         #  - G (ground)         : downward when positive into the ground
         #  - H (sensible)       : upward when positive (surface->air)
         #  - E (latent)         : upward when positive
-        Kstar = out['Kstar'][idx]
-        Lstar = out['Lstar'][idx]
-        H = out['H'][idx]
-        E = out['E'][idx]
-        G = out['G'][idx]
-        # order values to match desired label order: K*, L*, G, H, E
-        vals = [Kstar, Lstar, G, H, E]
-        # Compute a global maximum flux across available animation data (A and B)
-        # so arrow lengths are scaled consistently relative to the largest
-        # heat/energy flux present in the current simulation.
-        maxv = 1.0
-        try:
-            ad = getattr(self, 'anim_data', None)
-            if ad is not None:
-                mags = []
-                for key in ('A', 'B'):
-                    out_all = ad.get(key)
-                    if out_all is None:
-                        continue
-                    for term in ('Kstar', 'Lstar', 'G', 'H', 'E'):
-                        try:
-                            arr = np.asarray(out_all.get(term, []))
-                            if arr.size:
-                                mags.append(np.nanmax(np.abs(arr)))
-                        except Exception:
-                            pass
-                if mags:
-                    maxv = float(max(1.0, max(mags)))
-                else:
-                    # fallback to current-frame max if no arrays available
-                    maxv = max(1.0, max(abs(v) for v in vals))
-            else:
-                maxv = max(1.0, max(abs(v) for v in vals))
-        except Exception:
-            maxv = max(1.0, max(abs(v) for v in vals))
+        # Decide whether this out is Material A by identity
+        ad = self.anim_data
+        isA = ad is not None and out is ad.get('A')
+        # values in label order K*, L*, G, H, E: one row of the (Nt, 5) stack
+        # cached per run, or read term by term for data that is not stored
+        seb = ad.get('A_SEB' if isA else 'B_SEB') if ad is not None else None
+        if seb is not None and out is ad.get('A' if isA else 'B'):
+            vals = seb[idx]
+        else:
+            vals = np.array([out[term][idx] for term in _SEB_TERMS], dtype=float)
+        # Arrow lengths are scaled relative to the largest heat/energy flux in
+        # the current simulation (A and B), scanned once per run; fall back
+        # to the current frame when no run data is stored.
+        fmax = ad.get('Fmax') if ad is not None else None
+        if fmax is not None:
+            maxv = max(1.0, fmax)
+        else:
+            maxv = max(1.0, float(np.abs(vals).max()))
         # Arrange arrows side-by-side at the surface (z=0) in data coordinates.
         # If this `out` corresponds to Material A, center the arrows at T=0°C
         # so they appear around x=0; if it's Material B, place them on the
         # right-hand side. Use a tighter horizontal packing so arrows are
         # visually closer together.
         # show arrows in requested order: K*, L*, G, H, E
-        labels = ['K*', 'L*', 'G', 'H', 'E']
-        # map colors to the same order
-        colors = ['orange', 'magenta', 'saddlebrown', 'green', 'blue']
-        try:
-            x0, x1 = ax.get_xlim()
-            y0, y1 = ax.get_ylim()
-            x_width = x1 - x0 if (x1 - x0) != 0 else 1.0
-            y_height = y1 - y0 if (y1 - y0) != 0 else 1.0
-        except Exception:
-            x0, x1 = 0.0, 1.0
-            y0, y1 = 0.0, 1.0
-            x_width = 1.0
-            y_height = 1.0
+        labels = self._SEB_LABELS
+        if pool is None:
+            pool = self._make_seb_artists(ax, animated=animated)
+        (x0, x1), (y0, y1) = lims if lims is not None else (ax.get_xlim(), ax.get_ylim())
+        x_width = x1 - x0 if (x1 - x0) != 0 else 1.0
 
         # We'll draw arrows in axes-fraction coordinates so their on-screen
         # size is stable across frames regardless of changing data limits.
@@ -1556,168 +1804,158 @@ class App(ctk.CTk):
         block_frac = 0.04  # 4% of axis width per arrow
         right_margin_frac = 0.02
 
-        centers = []
-        # Decide whether this out is Material A by identity (fallback to False)
-        try:
-            ad = getattr(self, 'anim_data', None)
-            isA = (ad is not None and out is ad.get('A'))
-        except Exception:
-            isA = False
-
-        thickA = float(self.thickA.get())
-        thickB = float(self.thickB.get()) if getattr(self, 'compare_var', None) and bool(self.compare_var.get()) else 0.0
-        thick = thickA if isA else thickB
-
+        ks = np.arange(len(labels))
         if isA:
-            # center arrows around x=0 (data coordinate). Use small dx spacing
-            dx = block_frac * x_width
-            mid = 0.0
-            # centers left-to-right around mid (in data coordinates)
-            for k in range(len(labels)):
-                cx = mid + (k - (len(labels) - 1) / 2.0) * dx
-                centers.append(cx)
+            # center arrows left-to-right around x=0 (data coordinate) with
+            # small dx spacing
+            centers = (ks - (len(labels) - 1) / 2.0) * (block_frac * x_width)
         else:
             # place arrows near the right edge, arranged right-to-left (in data coords)
-            for k in range(len(labels)):
-                center_frac = 1.0 - right_margin_frac - (k + 0.5) * block_frac
-                cx = x0 + center_frac * x_width
-                centers.append(cx)
-
-        for k, v in enumerate(vals):
-            # skip near-zero terms to avoid clutter (no arrow or descriptor)
-            eps = 1e-6
-            if abs(v) <= eps:
+            centers = x0 + (1.0 - right_margin_frac - (ks + 0.5) * block_frac) * x_width
+
+        # arrow centers at the surface (z=0) in axes-fraction coords, in one
+        # transform call for the whole group
+        surf = np.column_stack((centers, np.zeros(len(centers))))
+        surf_frac = ax.transAxes.inverted().transform(ax.transData.transform(surf))
+        fy = surf_frac[:, 1]
+
+        # arrow length as fraction of axis height in axes-fraction coords,
+        # scaled by flux magnitude so relative lengths still reflect
+        # magnitudes (0.4 of the axes height for the largest flux); the sign
+        # gives the direction: K*, L*, G point down when positive, H and E up
+        dy = self._SEB_SIGNS * 0.4 * vals / maxv
+        end_y = fy + dy
+        # place the label slightly beyond the arrow tip in axes-fraction units
+        label_y = end_y + np.copysign(0.02, dy)
+        # hide near-zero terms to avoid clutter (no arrow or descriptor)
+        shown = np.abs(vals) > 1e-6
+
+        for k in range(len(labels)):
+            arrow = pool['arrows'][k]
+            label = pool['labels'][k]
+            if not shown[k]:
+                arrow.set_visible(False)
+                label.set_visible(False)
                 continue
-            # arrow length as fraction of axis height in axes-fraction coords,
-            # scaled by flux magnitude so relative lengths still reflect magnitudes.
-            # Multiply by 2.0 to make the maximum size two times larger as requested.
-            arrow_frac = 0.08 * (abs(v) / maxv) * 1.25 * 4.0
-
-            # convert arrow center x (data coord) and surface y=0 to axes-fraction coords
-            try:
-                disp = ax.transData.transform((centers[k], 0.0))
-                fx, fy = ax.transAxes.inverted().transform(disp)
-            except Exception:
-                # fallback: place near right/top if transform fails
-                fx = 0.9 if not isA else 0.1
-                fy = 0.5
-
-            # determine direction: for indices 0..2 positive -> downward (decrease fy),
-            # for 3..4 positive -> upward (increase fy)
-            direction = -1.0 if k in (0, 1, 2) else 1.0
-            if v < 0:
-                direction *= -1.0
-
-            start_frac = (fx, fy)
-            end_frac = (fx, fy + direction * arrow_frac)
-
-            # draw arrow in axes-fraction coords so screen size is stable
-            try:
-                ax.annotate('', xy=end_frac, xytext=start_frac, xycoords='axes fraction', textcoords='axes fraction', arrowprops=dict(arrowstyle='-|>', color=colors[k], lw=2))
-            except Exception:
-                pass
-
+            fx = surf_frac[k, 0]
+            # arrow in axes-fraction coords so screen size is stable
+            arrow.xy = (fx, end_y[k])
+            arrow.xyann = (fx, fy[k])
+            arrow.set_visible(True)
             # label and value: use axes-fraction coordinates as well
-            try:
-                txt = f"{labels[k]} {v:+.0f} W/m2"
-                # place the label slightly beyond the arrow tip in axes-fraction units
-                label_offset_frac = 0.02
-                tip_x_frac = fx
-                tip_y_frac = end_frac[1] + ( -label_offset_frac if end_frac[1] < fy else label_offset_frac )
-                ax.text(tip_x_frac, tip_y_frac, txt, ha='center', va='center', fontsize=9, color=colors[k], transform=ax.transAxes)
-            except Exception:
-                pass
+            label.set_position((fx, label_y[k]))
+            label.set_text(f"{labels[k]} {vals[k]:+.0f} W/m2")
+            label.set_visible(True)
 
         # place material label above the arrow group at a height that is
         # consistent for both A and B (use the axes y-limits which were set
         # based on the maximum thickness). This ensures labels for A and B
         # are plotted at the same vertical position even when thicknesses
         # differ.
-        try:
-            # use current y-limits to infer the largest thickness shown
-            try:
-                ay0, ay1 = ax.get_ylim()
-            except Exception:
-                ay0, ay1 = y0, y1
-            # ay0 is usually the negative depth baseline (e.g. -thickness)
-            if ay0 is not None and ay0 < 0:
-                total_thick = abs(ay0)
+        # the y-limits are [-thickness, thickness/2] for the largest
+        # thickness shown; y0 is that negative depth baseline
+        total_thick = abs(y0) if y0 < 0 else abs(y1)
+        mat_label_y = 0.4 * total_thick
+        group_x = float(centers.mean())
+        # Prefer the provided `mat` metadata (from run_simulation) to label
+        # the group; fall back to the UI selection variables `matA`/`matB`.
+        mat_label = None
+        if mat is not None:
+            if isinstance(mat, Mapping):
+                mat_label = mat.get('name') or mat.get('key') or mat.get('label')
             else:
-                total_thick = abs(ay1) if ay1 is not None else abs(thick)
-            mat_label_y = 0.4 * total_thick
-            group_x = sum(centers) / len(centers) if centers else (x0 + x1) / 2.0
-            # Prefer the provided `mat` metadata (from run_simulation) to label
-            # the group; fall back to the UI selection variables `matA`/`matB`.
-            mat_label = None
-            try:
-                if mat is not None:
-                    if isinstance(mat, Mapping):
-                        mat_label = mat.get('name') or mat.get('key') or mat.get('label')
-                    else:
-                        mat_label = getattr(mat, 'name', None) or getattr(mat, 'key', None) or getattr(mat, 'label', None)
-            except Exception:
-                mat_label = None
-            if not mat_label:
-                try:
-                    mat_label = self.matA.get() if isA else self.matB.get()
-                except Exception:
-                    mat_label = 'Material A' if isA else 'Material B'
-
-            # Format as requested: "A. Name" or "B. Name"
-            prefix = 'A.' if isA else 'B.'
-            mat_name = f"{prefix} {mat_label}"
-            ax.text(group_x, mat_label_y, mat_name, ha='center', va='bottom', fontsize=10, fontweight='bold')
-        except Exception:
-            pass
+                mat_label = getattr(mat, 'name', None) or getattr(mat, 'key', None) or getattr(mat, 'label', None)
+        if not mat_label:
+            mat_label = self.matA.get() if isA else self.matB.get()
+
+        # Format as requested: "A. Name" or "B. Name"
+        prefix = 'A.' if isA else 'B.'
+        mat_name = f"{prefix} {mat_label}"
+        pool['name'].set_position((group_x, mat_label_y))
+        pool['name'].set_text(mat_name)
+        pool['name'].set_visible(True)
+        return self._seb_pool_artists(pool)
+
+    def _on_temp_slider(self, value):
+        """Slider callback: redraw only when the time index actually changes.
+
+        A drag fires the command for every pointer motion, most of which land
+        on the index that is already shown.
+        """
+        idx = int(float(value))
+        if idx != self._temp_idx:
+            self.update_tempseb(idx)
+
+    def _draw_tempseb_static(self, key):
+        """Rebuild the Temp & SEB axes for a layout ``(thickA, thickB, comparing)``.
+
+        Creates the soil patch, surface line(s), persistent profile lines and
+        SEB arrow pools; ``update_tempseb`` then only updates their data.
+        """
+        thickA, thickB, comparing = key
+        ax = self.ax_temp
+        ax.clear()
+        self._temp_bg = None
+        # same limits and soil layout as the animation view; the limits are
+        # fixed, so the profiles can be blitted
+        self._temp_lims = self._draw_profile_background(ax, thickA, thickB, comparing)
+        # profile lines start at index 0; the depth axis is fixed per run, so
+        # update_tempseb only replaces their temperatures
+        anim = self.anim_data
+        self._temp_lines = {'A': ax.plot(anim['A_TC'][0], anim['A']['z'], '-r', label='A', animated=True)[0]}
+        self._temp_seb = {'A': self._make_seb_artists(ax, animated=True)}
+        if comparing:
+            self._temp_lines['B'] = ax.plot(anim['B_TC'][0], anim['B']['z'], '-b', label='B', animated=True)[0]
+            self._temp_seb['B'] = self._make_seb_artists(ax, animated=True)
+        self._temp_artists = list(self._temp_lines.values())
+        for pool in self._temp_seb.values():
+            self._temp_artists += self._seb_pool_artists(pool)
+        self._temp_static_key = key
+
+    def _on_temp_draw(self, event=None):
+        """Capture the Temp & SEB background after a full canvas draw."""
+        self._temp_bg = self.canvas_temp.copy_from_bbox(self.fig_temp.bbox)
+        self._draw_temp_artists()
+
+    def _draw_temp_artists(self):
+        """Draw the animated Temp & SEB artists (profiles, SEB arrows)."""
+        for a in self._temp_artists:
+            self.ax_temp.draw_artist(a)
 
     def update_tempseb(self, idx: int):
         """Draw temperature profile and SEB arrows at a given time index."""
-        anim_data = getattr(self, 'anim_data', None)
+        anim_data = self.anim_data
         if anim_data is None:
             return
+        self._temp_idx = idx
         outA = anim_data.get('A')
-        outB = anim_data.get('B') if self.compare_var.get() else None
-        self.ax_temp.clear()
-        self.ax_temp.plot(outA['T_profiles'][idx] - 273.15, outA['z'], '-r', label='A')
+        comparing = bool(self.compare_var.get())
+        outB = anim_data.get('B') if comparing else None
+        thickA = self._params['thickness_A']
+        thickB = self._params['thickness_B'] if comparing else 0.0
+        key = (thickA, thickB, outB is not None)
+        if key != self._temp_static_key:
+            self._draw_tempseb_static(key)
+        ax = self.ax_temp
+        self._temp_lines['A'].set_xdata(anim_data['A_TC'][idx])
         if outB is not None:
-            self.ax_temp.plot(outB['T_profiles'][idx] - 273.15, outB['z'], '-b', label='B')
-        # set y-limits consistent with animation view: [-thickness, thickness/2]
-        thickA = float(self.thickA.get())
-        thickB = float(self.thickB.get()) if getattr(self, 'compare_var', None) and bool(self.compare_var.get()) else 0.0
-        thick = max(thickA, thickB, 0.1)
-        try:
-            self.ax_temp.set_ylim(-thick, thick / 2.0)
-        except Exception:
-            pass
-        # draw soil patch and surface line similar to animation view
-        try:
-            self.ax_temp.axhspan(ymin=-thick, ymax=0.0, facecolor='lightgrey', zorder=0, alpha=0.5)
-        except Exception:
-            pass
-        try:
-            self.ax_temp.axhline(y=0.0, color='k', linewidth=1.0, zorder=3)
-        except Exception:
-            pass
-        try:
-            if getattr(self, 'compare_var', None) and bool(self.compare_var.get()):
-                if abs(thickA - thickB) > 1e-6:
-                    other_thick = min(thickA, thickB)
-                    self.ax_temp.axhline(y=-other_thick, color='k', linestyle='-.', linewidth=1.0, zorder=3)
-        except Exception:
-            pass
-        # keep normal y-axis orientation so depth increases downward
-        self.ax_temp.set_xlabel('Temperature (Â°C)')
-        self.ax_temp.set_ylabel('Depth (m)')
-        # draw arrows for A on same axis (offset x slightly)
-        self.draw_seb_arrows(self.ax_temp, outA, idx)
+            self._temp_lines['B'].set_xdata(anim_data['B_TC'][idx])
+        # move the pooled SEB arrows for A and B to this index
+        self.draw_seb_arrows(ax, outA, idx, pool=self._temp_seb['A'], lims=self._temp_lims)
         if outB is not None:
-            # for B, draw arrows slightly left by translating transform
-            self.draw_seb_arrows(self.ax_temp, outB, idx)
-        self.canvas_temp.draw()
+            self.draw_seb_arrows(ax, outB, idx, pool=self._temp_seb['B'], lims=self._temp_lims)
+        # blit over the cached background; until a full draw has captured it
+        # (after a layout change or resize) request an idle draw instead
+        if self._temp_bg is None:
+            self.canvas_temp.draw_idle()
+            return
+        self.canvas_temp.restore_region(self._temp_bg)
+        self._draw_temp_artists()
+        self.canvas_temp.blit(self.fig_temp.bbox)
 
     # --- Temp & SEB playback ---
     def toggle_temp_playback(self):
-        if not getattr(self, 'anim_data', None):
+        if not self.anim_data:
             messagebox.showerror('Error', 'Run a simulation first')
             return
         self.temp_playing = not self.temp_playing
@@ -1727,27 +1965,26 @@ class App(ctk.CTk):
 
     def temp_play_step(self):
         # guard: stop if app closed or playback flag cleared
-        if getattr(self, '_closed', False):
+        if self._closed:
             self.temp_playing = False
             return
         if not self.temp_playing:
             return
-        if hasattr(self, 'winfo_exists') and not self.winfo_exists():
+        if not self.winfo_exists():
             self.temp_playing = False
             return
-        anim_data = getattr(self, 'anim_data', None)
+        anim_data = self.anim_data
         if anim_data is None:
             self.temp_playing = False
             return
         outA = anim_data.get('A')
-        n = len(outA['times'])
+        n = len(outA['t'])
         # advance slider
         cur = int(float(self.temp_slider.get()))
         nxt = (cur + 1) % max(1, n)
         self.temp_slider.set(nxt)
         self.update_tempseb(nxt)
-        delay = int(max(100, 1000 / max(0.001, float(self.speed_var.get() or 1.0))))
-        self._temp_after_id = self.after(delay, self.temp_play_step)
+        self._temp_after_id = self.after(self._temp_period_ms, self.temp_play_step)
 
     # --- Run simulation and populate results + animation data ---
     def _on_run(self):
@@ -1761,18 +1998,25 @@ class App(ctk.CTk):
         if not ok:
             return
 
-        t = threading.Thread(target=self._run_thread, daemon=True)
+        # read the remaining Tk variables here: the worker must not touch Tk
+        self._running = True
+        self._status_text = 'Running simulation...'
+        args = (self.matA.get(), self.matB.get(), bool(self.compare_var.get()))
+        self._start_sim_pool()
+        t = threading.Thread(target=self._run_thread, args=args, daemon=True)
         t.start()
+        self._sim_after_id = self.after(50, self._drain_sim_results)
 
-    def _run_thread(self):
+    def _run_thread(self, matA_key: str, matB_key: str, compare: bool):
         """Worker thread that builds forcing, loads materials and runs the model.
 
-        Only ``load_material`` is guarded for file-read errors. All Tk updates
-        are scheduled back on the main thread.
+        The model runs are submitted to ``self._sim_pool`` and this thread
+        only waits for them. ``load_material`` and the pool calls are guarded,
+        so every run ends with a message. The worker never touches Tk or the
+        pool itself: it posts ``('ok', results)``, ``('error', msg)`` or, when
+        a worker process died, ``('broken', msg)`` to ``self._sim_queue``,
+        which the main thread drains.
         """
-        # mark running and update status (store internally only)
-        self._running = True
-        self._status_text = 'Running simulation...'
         # inputs are validated when the user leaves each input box and saved
         # into self._params by _validate_and_store. Use those canonical values.
         p = getattr(self, '_params', {})
@@ -1793,8 +2037,8 @@ class App(ctk.CTk):
         forcing_dt = float(self.GUIDEFAULTS['forcing_dt'])
         forcing_t = np.arange(0.0, float(tmax) + forcing_dt, forcing_dt)
         Ta_arr, S0_arr = diurnal_forcing(forcing_t, Ta_mean=Ta_mean, Ta_amp=Ta_amp, Sb=Sb, trise=trise, tset=tset)
-        Ldown_arr = np.full_like(forcing_t, float(Ldown))
-        forcing = {'t': forcing_t, 'Ta': Ta_arr, 'Kdown': S0_arr, 'Ldown': Ldown_arr}
+        # Ldown is constant; the model accepts it as a scalar
+        forcing = {'t': forcing_t, 'Ta': Ta_arr, 'Kdown': S0_arr, 'Ldown': float(Ldown)}
 
         params = {
             'beta': float(p.get('beta', MODEL_DEFAULTS['beta'])),
@@ -1804,98 +2048,209 @@ class App(ctk.CTk):
         }
         # Catch file-read errors only when loading materials
         try:
-            mA = load_material(self.matA.get())
+            mA = load_material(matA_key)
         except Exception as exc:
-            self.after(0, lambda: messagebox.showerror('Material', f"Failed to load material A: {exc}"))
-            self.after(0, lambda: setattr(self, '_running', False))
+            self._sim_queue.put(('error', f"Failed to load material A: {exc}"))
             return
-        outA = run_simulation(mA, params, dt, tmax)
-        outB = None
         mB = None
-        if self.compare_var.get():
+        if compare:
             try:
-                mB = load_material(self.matB.get())
+                mB = load_material(matB_key)
             except Exception as exc:
-                self.after(0, lambda: messagebox.showerror('Material', f"Failed to load material B: {exc}"))
-                self.after(0, lambda: setattr(self, '_running', False))
+                self._sim_queue.put(('error', f"Failed to load material B: {exc}"))
                 return
-            params_b = params.copy()
-            params_b['thickness'] = float(p['thickness_B'])
-            outB = run_simulation(mB, params_b, dt, tmax)
+        pool = self._sim_pool
+        # published before submitting so _stop_sim_pool can cancel them
+        futures = self._sim_futures = []
+        try:
+            # both runs are submitted before waiting, so they overlap
+            futA = pool.submit(run_simulation, mA, params, dt, tmax)
+            futures.append(futA)
+            futB = None
+            if compare:
+                params_b = params.copy()
+                params_b['thickness'] = float(p['thickness_B'])
+                futB = pool.submit(run_simulation, mB, params_b, dt, tmax)
+                futures.append(futB)
+            outA = futA.result()
+            outB = futB.result() if futB is not None else None
+        except BrokenProcessPool as exc:
+            # a worker died (crash, out of memory); the main thread replaces
+            # the unusable pool when it picks this up
+            self._sim_queue.put(('broken', f"Simulation workers stopped unexpectedly: {exc}"))
+            return
+        except Exception as exc:
+            self._sim_queue.put(('error', f"Simulation failed: {exc}"))
+            return
+
+        self._sim_queue.put(('ok', (outA, outB, mA, mB)))
+
+    def _drain_sim_results(self):
+        """Poll the worker queue on the main thread while a run is in flight."""
+        self._sim_after_id = None
+        if self._closed:
+            return
+        try:
+            status, payload = self._sim_queue.get_nowait()
+        except queue.Empty:
+            self._sim_after_id = self.after(50, self._drain_sim_results)
+            return
+        if status == 'ok':
+            self._apply_sim_result(*payload)
+            return
+        if status == 'broken':
+            # start fresh workers here on the Tk thread, before the dialog
+            self._stop_sim_pool()
+            self._start_sim_pool()
+        self._running = False
+        messagebox.showerror('Simulation', payload)
 
+    def _apply_sim_result(self, outA, outB: Optional[dict], mA: Optional[object], mB: Optional[object]):
+        """Store a finished run and refresh all views (main thread only)."""
+        # rebuild the Temp & SEB axes for the new run on their next update
+        self._temp_static_key = None
         # store for animation and update UI
-        self.anim_data = {'A': outA, 'A_mat': mA, 'B': outB, 'B_mat': mB}
-        self.after(0, lambda: self._show_results(outA, outB, mA, mB))
-        self.after(0, lambda: self.draw_anim_static())
-        nsteps = len(outA['t'])
-        self.temp_slider.configure(to=max(1, nsteps - 1), number_of_steps=max(1, nsteps - 1))
-        self.temp_slider.set(0)
+        # the profiles are converted to °C and their ranges (and the largest
+        # flux, which scales the SEB arrows) scanned once here; the animation
+        # and slider views index these per frame
+        TA_C = _profiles_C(outA)
+        TB_C = _profiles_C(outB)
+        SA = _seb_stack(outA)
+        SB = _seb_stack(outB)
+        # plotted series for the result views; the hours array is shared by
+        # every line and kept across runs on the same time grid, so _set_line
+        # can leave the lines' x data alone
+        sA = _plot_series(outA, self._plot_t_h, SA)
+        sB = _plot_series(outB, sA['t_h'], SB)
+        self._plot_t_h = sA['t_h']
+        self.anim_data = {'A': outA, 'A_mat': mA, 'B': outB, 'B_mat': mB,
+                          'A_TC': TA_C, 'B_TC': TB_C,
+                          'A_Trange': _profile_range_C(TA_C), 'B_Trange': _profile_range_C(TB_C),
+                          'A_SEB': SA, 'B_SEB': SB,
+                          # per-frame time labels, formatted once per run
+                          'Tlabels': [f'Time: {h:.2f} h' for h in outA['t'] / hour],
+                          'Fmax': _flux_max(sA['seb_range'], sB and sB['seb_range'])}
+        self._show_results(outA, outB, mA, mB, sA, sB)
+        self.draw_anim_static()
         self.btn_start.configure(state='normal')
-        self.after(0, lambda: self.btn_reset.configure(state='normal'))
-        self.after(0, lambda: setattr(self, '_status_text', 'Simulation complete'))
-        self.after(0, lambda: setattr(self, '_running', False))
+        self.btn_reset.configure(state='normal')
+        self._status_text = 'Simulation complete'
+        self._running = False
 
     def _on_closing(self):
         """Clean shutdown: cancel scheduled callbacks and stop loops before destroying the window."""
         # hide any tooltip immediately to avoid orphaned Toplevels
         self._hide_material_tooltip()
-        # stop loops
+        # stop loops (and any pending result polling)
+        self._closed = True
         self.animating = False
         self.temp_playing = False
 
         # cancel scheduled after callbacks if present
-        pid = getattr(self, '_preview_after_id', None)
-        if pid is not None:
-            self.after_cancel(pid)
-            self._preview_after_id = None
-        pid = getattr(self, '_poll_after_id', None)
-        if pid is not None:
-            self.after_cancel(pid)
-            self._poll_after_id = None
-        pid = getattr(self, '_anim_after_id', None)
-        if pid is not None:
-            self.after_cancel(pid)
-            self._anim_after_id = None
-        pid = getattr(self, '_temp_after_id', None)
-        if pid is not None:
-            self.after_cancel(pid)
-            self._temp_after_id = None
+        for attr in self._AFTER_ID_ATTRS:
+            pid = getattr(self, attr, None)
+            if pid is not None:
+                self.after_cancel(pid)
+                setattr(self, attr, None)
+        # stop the simulation workers without waiting for a run in flight
+        self._stop_sim_pool()
+
+        # drop the artists (and cached blit background) so nothing keeps the
+        # run arrays alive while Tk tears the widgets down
+        self._anim_bg = None
+        self._anim_artists = []
+        self._anim_seb = {}
+        self._anim_lims = None
+        self._temp_lines = {}
+        self._temp_seb = {}
+        self._temp_artists = []
+        self._temp_bg = None
+        self._res_pending = None
+        self._tbt_pending = None
+        self._line_t = {}
+        self._plot_t_h = None
+        for attr in self._FIGURE_ATTRS:
+            fig = getattr(self, attr, None)
+            if fig is not None:
+                fig.clear()
 
         # destroy the window (ends mainloop)
         self.destroy()
 
-    def _show_results(self, outA, outB: Optional[dict], mA: Optional[object] = None, mB: Optional[object] = None):
-        # split plotting into dedicated tab plotters for clarity
-        self._plot_results_tab(outA, outB, mA, mB)
-        self._plot_term_by_term(outA, outB, mA, mB)
+    def _show_results(self, outA, outB: Optional[dict], mA: Optional[object] = None, mB: Optional[object] = None,
+                      sA: Optional[dict] = None, sB: Optional[dict] = None):
+        # split plotting into dedicated tab plotters for clarity. Both only
+        # swap line data and request one idle draw of their own canvas, and
+        # each is deferred until its tab is visible, so a run costs at most
+        # a single draw of the canvas being looked at.
+        # the derived series (hours, °C, flux views) are shared by both
+        sA = sA or _plot_series(outA)
+        sB = sB or _plot_series(outB)
+        self._res_pending = self._tbt_pending = (outA, outB, mA, mB, sA, sB)
+        cur = self.tabview.get()
+        if cur == 'Results':
+            self._flush_results()
+        elif cur == 'Term by term':
+            self._flush_term_by_term()
+
+    def _flush_results(self):
+        """Draw pending results into the Results tab, if any."""
+        pending = self._res_pending
+        if pending is None or self._closed:
+            return
+        self._res_pending = None
+        self._plot_results_tab(*pending)
+
+    def _flush_term_by_term(self):
+        """Draw pending results into the Term-by-term tab, if any."""
+        pending = self._tbt_pending
+        if pending is None or self._closed:
+            return
+        self._tbt_pending = None
+        self._plot_term_by_term(*pending)
+        nsteps = len(pending[0]['t'])
+        self.temp_slider.configure(to=max(1, nsteps - 1), number_of_steps=max(1, nsteps - 1))
+        self.temp_slider.set(0)
         # update Temp & SEB panel (time index 0 default)
         self.update_tempseb(0)
 
-    def _plot_results_tab(self, outA, outB: Optional[dict], mA: Optional[object] = None, mB: Optional[object] = None):
+    def _set_line(self, line, t, y):
+        """Set a persistent results line's data; x only for a new time array."""
+        if self._line_t.get(line) is t:
+            line.set_ydata(y)
+        else:
+            line.set_data(t, y)
+            self._line_t[line] = t
+
+    def _plot_results_tab(self, outA, outB: Optional[dict], mA: Optional[object] = None, mB: Optional[object] = None,
+                          sA: Optional[dict] = None, sB: Optional[dict] = None):
         """Populate the Results tab plots.
 
         Layout is 2x1 for a single material and 2x2 when comparing A vs B.
+        ``sA``/``sB`` are the runs' ``_plot_series``, computed if omitted.
         """
-        t = outA['t'] / hour
-        self.fig_res.clf()
-        if outB is None:
-            self.axs_res = self.fig_res.subplots(2, 1, squeeze=False)
-        else:
-            self.axs_res = self.fig_res.subplots(2, 2, squeeze=False)
-
-        def plot_energy(ax, out, mat_obj):
-            ax.clear()
-            ax.plot(t, out['Kstar'], color='orange', label='K*')
-            ax.plot(t, out['Lstar'], color='magenta', label='L*')
-            ax.plot(t, out['H'], color='green', label='H')
-            if self._mat_allows_evap(mat_obj):
-                ax.plot(t, out['E'], color='blue', label='E')
-            else:
-                ax.plot(t, np.zeros_like(out['t']), color='blue', label='E')
-            ax.plot(t, out['G'], color='saddlebrown', label='G')
-            ax.set_ylabel('Flux (W/m2)')
-            ax.set_xlabel('Time (h)')
-            ax.legend(loc='upper right', fontsize='small')
+        sA = sA or _plot_series(outA)
+        sB = sB or _plot_series(outB)
+        t = sA['t_h']
+        # show the layout matching the run and hide the other one
+        compare = outB is not None
+        for cmp_, axs_ in self._res_axes.items():
+            for ax in axs_.flat:
+                ax.set_visible(cmp_ == compare)
+        self.axs_res = self._res_axes[compare]
+
+        def plot_energy(ax, s):
+            lines = self._res_lines[ax]
+            self._set_line(lines['K*'], t, s['Kstar'])
+            self._set_line(lines['L*'], t, s['Lstar'])
+            self._set_line(lines['H'], t, s['H'])
+            # run_simulation already returns E as zeros for materials
+            # without evaporation
+            self._set_line(lines['E'], t, s['E'])
+            self._set_line(lines['G'], t, s['G'])
+            # re-enable autoscaling (compare mode pins shared y-limits)
+            ax.relim()
+            ax.autoscale()
 
         def _mat_title(mat_obj, fallback_name: str):
             if mat_obj is None:
@@ -1904,39 +2259,37 @@ class App(ctk.CTk):
                 return str(mat_obj.get('name', fallback_name))
             return str(getattr(mat_obj, 'name', fallback_name))
 
-        def plot_ts(ax, out, title=None):
-            ax.clear()
-            # plot surface temperature (Ts)
-            ax.plot(t, out['Ta'] - 273.15, color='k', label='Ta')
-            ax.plot(t, out['Ts'] - 273.15, color='r', label='Ts')
-            ax.set_ylabel('T (°C)')
-            ax.set_xlabel('Time (h)')
-            if title:
-                ax.set_title(title)
-            ax.legend(loc='upper right', fontsize='small')
+        def plot_ts(ax, s, title=None):
+            lines = self._res_lines[ax]
+            # plot air and surface temperature (Ta, Ts)
+            self._set_line(lines['Ta'], t, s['Ta'])
+            self._set_line(lines['Ts'], t, s['Ts'])
+            ax.set_title(title or '')
+            ax.relim()
+            ax.autoscale()
 
         axs = self.axs_res
 
         if outB is None:
             # Single-material layout has shape (2,1); only use column 0
             matA_name = _mat_title(mA, self.matA.get() if getattr(self, 'matA', None) is not None else 'Material A')
-            plot_ts(axs[0][0], outA, title=matA_name)
-            plot_energy(axs[1][0], outA, mA)
+            plot_ts(axs[0][0], sA, title=matA_name)
+            plot_energy(axs[1][0], sA)
         else:
-            for j in (0, 1):
-                axs[j][1].set_visible(True)
             matA_name = _mat_title(mA, self.matA.get() if getattr(self, 'matA', None) is not None else 'Material A')
             matB_name = _mat_title(mB, self.matB.get() if getattr(self, 'matB', None) is not None else 'Material B')
-            plot_ts(axs[0][0], outA, title=matA_name)
-            plot_ts(axs[0][1], outB, title=matB_name)
-            plot_energy(axs[1][0], outA, mA)
-            plot_energy(axs[1][1], outB, mB)
-
-            tsA = np.asarray(outA.get('Ts', [])) - 273.15
-            tsB = np.asarray(outB.get('Ts', [])) - 273.15
-            if tsA.size and tsB.size:
-                ymin = float(np.nanmin([np.nanmin(tsA), np.nanmin(tsB)]))
-                ymax = float(np.nanmax([np.nanmax(tsA), np.nanmax(tsB)]))
+            plot_ts(axs[0][0], sA, title=matA_name)
+            plot_ts(axs[0][1], sB, title=matB_name)
+            plot_energy(axs[1][0], sA)
+            plot_energy(axs[1][1], sB)
+
+            # shared Ts limits from single-pass scans in Kelvin, converted
+            # afterwards (no °C copies of the series)
+            if len(outA['Ts']) and len(outB['Ts']):
+                loA, hiA = nan_min_max(outA['Ts'])
+                loB, hiB = nan_min_max(outB['Ts'])
+                ymin = float(np.nanmin([loA, loB])) - 273.15
+                ymax = float(np.nanmax([hiA, hiB])) - 273.15
                 if ymax == ymin:
                     pad = 0.5
                 else:
@@ -1944,22 +2297,9 @@ class App(ctk.CTk):
                 for a in (axs[0][0], axs[0][1]):
                     a.set_ylim(ymin - pad, ymax + pad)
 
-            def _energy_bounds(o, mat_obj):
-                tarr = o['t']
-                if len(tarr) == 0:
-                    return None
-                K = np.asarray(o.get('Kstar', np.zeros_like(tarr)))
-                L = np.asarray(o.get('Lstar', np.zeros_like(tarr)))
-                H = np.asarray(o.get('H', np.zeros_like(tarr)))
-                E = np.asarray(o.get('E', np.zeros_like(tarr)))
-                if not self._mat_allows_evap(mat_obj):
-                    E = np.zeros_like(E)
-                G = np.asarray(o.get('G', np.zeros_like(tarr)))
-                allv = np.concatenate([K, L, H, E, G]) if any(v.size for v in (K, L, H, E, G)) else np.array([0.0])
-                return float(np.nanmin(allv)), float(np.nanmax(allv))
-
-            bA = _energy_bounds(outA, mA)
-            bB = _energy_bounds(outB, mB)
+            # flux ranges scanned once per run over its SEB stack
+            bA = sA['seb_range']
+            bB = sB['seb_range']
             if bA is not None and bB is not None:
                 ymin = min(bA[0], bB[0])
                 ymax = max(bA[1], bB[1])
@@ -1969,112 +2309,89 @@ class App(ctk.CTk):
                     pad = 0.05 * (ymax - ymin)
                 for a in (axs[1][0], axs[1][1]):
                     a.set_ylim(ymin - pad, ymax + pad)
-        self.canvas_res.draw()
+        self.canvas_res.draw_idle()
+
+    # Term-by-term panels: grid position, y label, whether a legend is shown
+    # and the plotted series as (term, color, label); '-Kup'/'-Lup' are
+    # plotted negated (by the line transform) and 'Ta'/'Ts' in °C
+    _TBT_PANELS = (
+        ((0, 0), 'Ts (°C)', True, (('Ta', 'tab:orange', 'Ta'), ('Ts', 'black', 'Ts'))),
+        ((0, 1), 'K (W/m2)', True, (('Kstar', 'black', 'K*'), ('Kdown', 'tab:orange', 'Kdown'), ('-Kup', 'magenta', '-Kup'))),
+        ((1, 0), 'L (W/m2)', True, (('Lstar', 'black', 'L*'), ('Ldown', 'tab:orange', 'Ldown'), ('-Lup', 'magenta', '-Lup'))),
+        ((1, 1), 'H (W/m2)', False, (('H', 'black', None),)),
+        ((2, 0), 'E (W/m2)', False, (('E', 'black', None),)),
+        ((2, 1), 'G (W/m2)', False, (('G', 'black', None),)),
+    )
+
+    def _init_term_by_term_axes(self):
+        """Decorate the Term-by-term grid once and return its (empty) lines.
+
+        Lines are keyed by ``(term, material)``: solid for A, dashed for B
+        (shown only when comparing). Ta is drawn for A only, and B lines are
+        unlabelled except for Ts. Legends are made here for a single run.
+        '-Kup'/'-Lup' lines are given the raw flux and flip it in their
+        transform, so no negated copy is made.
+        """
+        lines = {}
+        for (r, c), ylabel, legend, series in self._TBT_PANELS:
+            ax = self.axs_temp_res[r][c]
+            flip = Affine2D().scale(1, -1) + ax.transData
+            for term, color, label in series:
+                kw = {'transform': flip} if term[0] == '-' else {}
+                lines[(term, 'A')] = ax.plot([], [], color=color, linestyle='-',
+                                             label=(label + ' A' if term == 'Ts' else label), **kw)[0]
+                if term != 'Ta':
+                    lines[(term, 'B')] = ax.plot([], [], color=color, linestyle='--',
+                                                 label=('Ts B' if term == 'Ts' else None), visible=False, **kw)[0]
+            ax.set_ylabel(ylabel)
+            ax.set_xlabel('Time (h)')
+            ax.grid(True, linestyle=':', alpha=0.4)
+        self._tbt_compare = None
+        self._tbt_legends(compare=False)
+        return lines
+
+    def _tbt_legends(self, compare: bool):
+        """(Re)build the Term-by-term legends for a single or compared run.
 
-    def _plot_term_by_term(self, outA, outB: Optional[dict], mA: Optional[object] = None, mB: Optional[object] = None):
-        """Populate the Term-by-term (Temp & SEB) compact grid (3x2)."""
-        axs_tr = getattr(self, 'axs_temp_res', None)
-        can_tr = getattr(self, 'canvas_temp_res', None)
-        if axs_tr is None:
+        Only the visible, labelled lines are listed; B adds 'Ts B' in
+        compare mode. Skipped when the mode is unchanged.
+        """
+        if compare == self._tbt_compare:
             return
-        styleA = '-'
-        styleB = '--'
-        color_ta = 'black'
-        color_kdown = 'tab:orange'
-        color_kup = 'magenta'
-        color_knet = 'black'
-        color_ldown = 'tab:orange'
-        color_lup = 'magenta'
-        color_lnet = 'black'
-        color_h = 'black'
-        color_e = 'black'
-        color_g = 'black'
-
-        if True:
-            # TS subplot
-            ax_ta = axs_tr[0][0]
-            ax_ta.clear()
-            # use time in hours for plotting
-            tA = outA['t'] / hour
-            tB = outB['t'] / hour if outB is not None else None
-            # plot surface temperature (Ts) in °C
-            ax_ta.plot(tA, outA['Ta'] - 273.15, color=color_kdown, linestyle=styleA, label='Ta')
-            ax_ta.plot(tA, outA['Ts'] - 273.15, color=color_ta, linestyle=styleA, label='Ts A')
-            if outB is not None:
-                ax_ta.plot(tB, outB['Ts'] - 273.15, color=color_ta, linestyle=styleB, label='Ts B')
-            ax_ta.set_ylabel('Ts (°C)')
-            ax_ta.set_xlabel('Time (h)')
-            ax_ta.grid(True, linestyle=':', alpha=0.4)
-            ax_ta.legend(loc='upper left', fontsize='small')
-
-            # K components subplot
-            ax_k = axs_tr[0][1]
-            ax_k.clear()
-            ax_k.plot(tA, outA['Kstar'], color=color_knet, linestyle=styleA, label='K*')
-            ax_k.plot(tA, outA['Kdown'], color=color_kdown, linestyle=styleA, label='Kdown')
-            ax_k.plot(tA, -outA['Kup'], color=color_kup, linestyle=styleA, label='-Kup')
-            if outB is not None:
-                ax_k.plot(tB, outB['Kdown'], color=color_knet, linestyle=styleB)
-                ax_k.plot(tB, outB['Kdown'], color=color_kdown, linestyle=styleB)
-                ax_k.plot(tB, -outB['Kup'], color=color_kup, linestyle=styleB)
-            ax_k.set_ylabel('K (W/m2)')
-            ax_k.set_xlabel('Time (h)')
-            ax_k.grid(True, linestyle=':', alpha=0.4)
-            ax_k.legend(loc='upper left', fontsize='small')
-
-            # L components subplot
-            ax_l = axs_tr[1][0]
-            ax_l.clear()
-            ax_l.plot(tA, outA['Lstar'], color=color_lnet, linestyle=styleA, label='L*')
-            ax_l.plot(tA, outA['Ldown'], color=color_ldown, linestyle=styleA, label='Ldown')
-            ax_l.plot(tA, -outA['Lup'], color=color_lup, linestyle=styleA, label='-Lup')
-            if outB is not None:
-                ax_l.plot(tB, outB['Lstar'], color=color_lnet, linestyle=styleB)
-                ax_l.plot(tB, outB['Ldown'], color=color_ldown, linestyle=styleB)
-                ax_l.plot(tB, -outB['Lup'], color=color_lup, linestyle=styleB)
-            ax_l.set_ylabel('L (W/m2)')
-            ax_l.set_xlabel('Time (h)')
-            ax_l.grid(True, linestyle=':', alpha=0.4)
-            ax_l.legend(loc='upper left', fontsize='small')
-
-            # H subplot
-            ax_h = axs_tr[1][1]
-            ax_h.clear()
-            ax_h.plot(tA, outA['H'], color=color_h, linestyle=styleA)
-            if outB is not None:
-                ax_h.plot(tB, outB['H'], color=color_h, linestyle=styleB)
-            ax_h.set_ylabel('H (W/m2)')
-            ax_h.set_xlabel('Time (h)')
-            ax_h.grid(True, linestyle=':', alpha=0.4)
-
-            # E subplot
-            ax_e = axs_tr[2][0]
-            ax_e.clear()
-            E_A = outA['E'] if 'E' in outA else np.zeros_like(outA['t'])
-            if not self._mat_allows_evap(mA):
-                E_A = np.zeros_like(E_A)
-            ax_e.plot(tA, E_A, color=color_e, linestyle=styleA)
-            if outB is not None:
-                E_B = outB['E'] if 'E' in outB else np.zeros_like(outB['t'])
-                if not self._mat_allows_evap(mB):
-                    E_B = np.zeros_like(E_B)
-                ax_e.plot(tB, E_B, color=color_e, linestyle=styleB)
-            ax_e.set_ylabel('E (W/m2)')
-            ax_e.set_xlabel('Time (h)')
-            ax_e.grid(True, linestyle=':', alpha=0.4)
-
-            # G subplot
-            ax_g = axs_tr[2][1]
-            ax_g.clear()
-            ax_g.plot(tA, outA['G'], color=color_g, linestyle=styleA)
-            if outB is not None:
-                ax_g.plot(tB, outB['G'], color=color_g, linestyle=styleB)
-            ax_g.set_ylabel('G (W/m2)')
-            ax_g.set_xlabel('Time (h)')
-            ax_g.grid(True, linestyle=':', alpha=0.4)
-
-        if can_tr is not None:
-            can_tr.draw()
+        self._tbt_compare = compare
+        for (r, c), _, legend, _ in self._TBT_PANELS:
+            if not legend:
+                continue
+            ax = self.axs_temp_res[r][c]
+            handles = [l for l in ax.get_lines()
+                       if l.get_label()[0] != '_' and (compare or l.get_linestyle() == '-')]
+            ax.legend(handles=handles, loc='upper left', fontsize='small')
+
+    def _plot_term_by_term(self, outA, outB: Optional[dict], mA: Optional[object] = None, mB: Optional[object] = None,
+                           sA: Optional[dict] = None, sB: Optional[dict] = None):
+        """Populate the Term-by-term (Temp & SEB) compact grid (3x2).
+
+        Updates the persistent lines made by ``_init_term_by_term_axes`` and
+        rescales each panel; legends are rebuilt only when the compare mode
+        changes.
+        ``sA``/``sB`` are the runs' ``_plot_series``, computed if omitted.
+        """
+        lines = self._tbt_lines
+        series = {'A': sA or _plot_series(outA), 'B': sB or _plot_series(outB)}
+        for (term, key), line in lines.items():
+            s = series[key]
+            if s is None:
+                line.set_visible(False)
+                continue
+            self._set_line(line, s['t_h'], s[term.lstrip('-')])
+            line.set_visible(True)
+        for (r, c), _, _, _ in self._TBT_PANELS:
+            ax = self.axs_temp_res[r][c]
+            # hidden B lines keep their previous run's data out of the limits
+            ax.relim(visible_only=True)
+            ax.autoscale_view()
+        self._tbt_legends(compare=outB is not None)
+        self.canvas_temp_res.draw_idle()
 
 if __name__ == '__main__':
     app = App()
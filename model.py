@@ -18,16 +18,27 @@ Key concepts
 """
 import numpy as np
 from dataclasses import dataclass
-import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Mapping, Any, Union, Optional
 from scipy.integrate import solve_ivp
-import matplotlib.pyplot as plt
+
+# optional faster JSON decoder; both accept the raw bytes of the file
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# optional JIT compiler for the forcing kernel; plain NumPy is used without it
+try:
+    from numba import njit as _njit
+except ImportError:
+    _njit = None
 
 # time unit helper
 hour = 3600
 
-@dataclass
+@dataclass(frozen=True)
 class Material:
     name: str
     k: float
@@ -56,9 +67,33 @@ DEFAULTS = {
     'insulating_layer': True,   # switch for bottom boundary condition
 }
 
+@lru_cache(maxsize=None)
+def read_materials(path: str = "materials.json") -> Mapping[str, Any]:
+    """Parse the repository materials file (cached per ``path``).
+
+    Parameters
+    ----------
+    path : str
+        Relative path to the materials file (default ``materials.json``).
+
+    Returns
+    -------
+    Mapping
+        Material key -> property dict, in file order. Treat as read-only:
+        the same object is returned on every call.
+    """
+    base = Path(__file__).parent
+    return _json_loads((base / path).read_bytes())
+
+
+@lru_cache(maxsize=None)
 def load_material(key: str, path: str = "materials.json") -> Material:
     """Load a material from the repository JSON file.
 
+    Results are cached per ``(key, path)``; the file is parsed only once.
+    ``Material`` is frozen, so the shared cached instance cannot be
+    modified by one caller behind another's back.
+
     Parameters
     ----------
     key : str
@@ -71,14 +106,11 @@ def load_material(key: str, path: str = "materials.json") -> Material:
     Material
         Dataclass populated with the material's properties.
     """
-    base = Path(__file__).parent
-    with open(base / path, "r", encoding="utf8") as f:
-        data = json.load(f)
-    d = data[key]
+    d = read_materials(path)[key]
     return Material(name=d["name"], k=d["k"], rho=d["rho"], cp=d["cp"], albedo=d["albedo"], emissivity=d["emissivity"], evaporation=d["evaporation"])
 
 
-def diurnal_forcing(t, Ta_mean, Ta_amp, Sb, trise, tset):
+def diurnal_forcing(t, Ta_mean, Ta_amp, Sb, trise, tset, out=None):
     """Build simple diurnal forcing (Ta and Kdown).
 
     Parameters
@@ -93,26 +125,69 @@ def diurnal_forcing(t, Ta_mean, Ta_amp, Sb, trise, tset):
         Peak shortwave (W/m2) used for the shortwave shape.
     trise, tset : float
         Sunrise and sunset times (s) used in ``kdown``.
+    out : tuple of ndarray, optional
+        Preallocated ``(Ta, S0)`` float arrays shaped like ``t`` to write
+        the results into (e.g. for repeated preview updates on a fixed
+        grid). New arrays are allocated when omitted.
 
     Returns
     -------
     (Ta, S0) : tuple of ndarray
-        Air temperature (K) and shortwave shape (W/m2).
+        Air temperature (K) and shortwave shape (W/m2); the ``out`` arrays
+        when given.
     """
+    t = np.asarray(t, dtype=float)
+    if out is None:
+        out = (np.empty_like(t), np.empty_like(t))
+    Ta, S0 = out
+    if _diurnal_kernel is not None and t.ndim == 1:
+        _diurnal_kernel(t, float(Ta_mean), float(Ta_amp), float(Sb), float(trise), float(tset), Ta, S0)
+        return Ta, S0
     # align Ta peak with shortwave peak: midpoint between trise and tset
-    t = np.asarray(t)
     t24 = np.mod(t, 24 * hour)
     tmid = 0.5 * (trise + tset)
-    phase = (t24 - tmid) / (24 * hour)
-    Ta = Ta_mean + Ta_amp * np.cos(2 * np.pi * phase)
-
-    # shortwave shape (kept simple here) - use kdown timings for parity
-    S0 = kdown(t, Sb, trise, tset)
-    # clip negative values to zero (night)
-    S0 = np.maximum(0.0, S0)
+    # Ta = Ta_mean + Ta_amp * cos(2 pi (t24 - tmid) / 24 h), built in Ta
+    np.subtract(t24, tmid, out=Ta)
+    Ta *= 2 * np.pi / (24 * hour)
+    np.cos(Ta, out=Ta)
+    Ta *= Ta_amp
+    Ta += Ta_mean
+
+    # shortwave shape (kept simple here) - use kdown timings for parity;
+    # negative values are clipped to zero (night)
+    np.maximum(0.0, kdown(t, Sb, trise, tset), out=S0)
     return Ta, S0
 
 
+def _diurnal_loop(t, Ta_mean, Ta_amp, Sb, trise, tset, Ta, S0):
+    """Single-pass loop form of ``diurnal_forcing`` for numba to compile.
+
+    Mirrors the NumPy expressions in ``diurnal_forcing`` and ``kdown``
+    element by element, writing into the given ``Ta`` and ``S0`` arrays;
+    only used when numba is installed. Compiled with numba's NumPy error
+    model, so a division by zero gives inf/nan like the NumPy path instead
+    of raising ZeroDivisionError.
+    """
+    n = t.shape[0]
+    day = 24.0 * hour
+    tmid = 0.5 * (trise + tset)
+    for i in range(n):
+        t24 = t[i] % day
+        Ta[i] = Ta_mean + Ta_amp * np.cos(2 * np.pi * (t24 - tmid) / day)
+        theta = (t24 - trise) / (tset - trise) * np.pi / 2 + (t24 - tset) / (tset - trise) * np.pi / 2
+        # value first so a NaN (trise == tset) propagates like np.maximum
+        theta = min(max(theta, -np.pi / 2), np.pi / 2)
+        S0[i] = max(Sb * np.cos(theta), 0.0)
+
+
+# compiled once and kept in numba's on-disk cache; the first call in a process
+# only loads it (the app's first preview update, while the window is built).
+# error_model='numpy' makes divisions by zero give inf/nan as in the NumPy
+# path. fastmath is left off: it saves about 1 us per 145-point preview call
+# and would let the compiler assume there are no NaNs or infs at all.
+_diurnal_kernel = _njit(cache=True, error_model='numpy')(_diurnal_loop) if _njit is not None else None
+
+
 def kdown(t, Sb, trise, tset):
     """Incoming shortwave irradiance (Kdown).
 
@@ -148,7 +223,8 @@ def sebrhs_noins(t, T, mat: Material, dz, forcing, h, beta=0.0, sigma=5.67037441
     dz : float
         Grid spacing (m).
     forcing : Mapping
-        Dict containing arrays 't', 'Ta', 'Kdown', 'Ldown'.
+        Dict containing arrays 't', 'Ta', 'Kdown' and 'Ldown' (an array or
+        a constant float).
     h : float
         Heat-transfer coefficient (W/m2/K).
     beta : float
@@ -163,16 +239,17 @@ def sebrhs_noins(t, T, mat: Material, dz, forcing, h, beta=0.0, sigma=5.67037441
     epsilon = mat.emissivity
 
     kappa = k / C
-    Nz = len(T)
     dTdt = np.zeros_like(T)
-    for i in range(1, Nz - 1):
-        dTdt[i] = kappa * (T[i - 1] - 2 * T[i] + T[i + 1]) / dz ** 2
+    # interior nodes: second-order central difference, evaluated as one
+    # slice expression rather than a Python loop over Nz
+    dTdt[1:-1] = kappa * (T[:-2] - 2 * T[1:-1] + T[2:]) / dz ** 2
 
-    # forcing is expected to be a mapping with keys 't', 'Ta', 'Kdown'
-    times_arr = np.asarray(forcing['t'], dtype=float)
-    S0_arr = np.asarray(forcing['Kdown'])
-    Ta_arr = np.asarray(forcing['Ta'])
-    Ldown_arr = np.asarray(forcing.get('Ldown'))
+    # forcing is expected to be a mapping with keys 't', 'Ta', 'Kdown';
+    # np.interp accepts array-likes, and run_simulation passes float arrays
+    times_arr = forcing['t']
+    S0_arr = forcing['Kdown']
+    Ta_arr = forcing['Ta']
+    Ldown_f = forcing.get('Ldown')
 
     # interpolate S0 (shortwave), Ta and Ldown at current time
     Kdown = np.interp(t, times_arr, S0_arr)
@@ -180,7 +257,8 @@ def sebrhs_noins(t, T, mat: Material, dz, forcing, h, beta=0.0, sigma=5.67037441
     Lup = epsilon * sigma * T[0] ** 4
 
     Ta = np.interp(t, times_arr, Ta_arr)
-    Ldown = np.interp(t, times_arr, Ldown_arr)
+    # Ldown may be given as a constant instead of a series
+    Ldown = np.interp(t, times_arr, Ldown_f) if np.ndim(Ldown_f) else float(Ldown_f)
 
     Qh = h * (T[0] - Ta)
     QE = Qh / beta if beta != 0 else 0.0
@@ -202,16 +280,17 @@ def sebrhs_ins(t, T, mat: Material, dz, forcing, h, beta=0.0, sigma=5.670374419e
     epsilon = mat.emissivity
 
     kappa = k / C
-    Nz = len(T)
     dTdt = np.zeros_like(T)
-    for i in range(1, Nz - 1):
-        dTdt[i] = kappa * (T[i - 1] - 2 * T[i] + T[i + 1]) / dz ** 2
+    # interior nodes: second-order central difference, evaluated as one
+    # slice expression rather than a Python loop over Nz
+    dTdt[1:-1] = kappa * (T[:-2] - 2 * T[1:-1] + T[2:]) / dz ** 2
 
-    # forcing is expected to be a mapping with keys 't', 'Ta', 'Kdown'
-    times_arr = np.asarray(forcing['t'], dtype=float)
-    S0_arr = np.asarray(forcing['Kdown'])
-    Ta_arr = np.asarray(forcing['Ta'])
-    Ldown_arr = np.asarray(forcing.get('Ldown'))
+    # forcing is expected to be a mapping with keys 't', 'Ta', 'Kdown';
+    # np.interp accepts array-likes, and run_simulation passes float arrays
+    times_arr = forcing['t']
+    S0_arr = forcing['Kdown']
+    Ta_arr = forcing['Ta']
+    Ldown_f = forcing.get('Ldown')
 
     # interpolate S0 (shortwave), Ta and Ldown at current time
     Kdown = np.interp(t, times_arr, S0_arr)
@@ -219,7 +298,8 @@ def sebrhs_ins(t, T, mat: Material, dz, forcing, h, beta=0.0, sigma=5.670374419e
     Lup = epsilon * sigma * T[0] ** 4
 
     Ta = np.interp(t, times_arr, Ta_arr)
-    Ldown = np.interp(t, times_arr, Ldown_arr)
+    # Ldown may be given as a constant instead of a series
+    Ldown = np.interp(t, times_arr, Ldown_f) if np.ndim(Ldown_f) else float(Ldown_f)
 
     Qh = h * (T[0] - Ta)
     QE = Qh / beta if beta != 0 else 0.0
@@ -246,7 +326,8 @@ def run_simulation(mat: Material,
     mat : Material
         Material properties.
     params : Mapping
-        Requires keys: 'beta', 'forcing', 'thickness', 'h'.
+        Requires keys: 'beta', 'forcing', 'thickness', 'h'. ``forcing['Ldown']``
+        may be a constant float instead of a series.
     dt : float
         Output time step (s) used for ``t_eval`` and ``max_step``.
     tmax : float
@@ -257,7 +338,9 @@ def run_simulation(mat: Material,
     dict
         Dictionary with keys: 't', 'Ta', 'Ts', 'Kstar', 'Kdown', 'Kup',
         'Lstar', 'Ldown', 'Lup', 'G', 'H', 'E', 'L', 'z', 'T_profile',
-        'T_profiles'.
+        'T_profiles'. Time series are 1-D float arrays aligned with 't';
+        'T_profiles' is a (len(t), Nz) array and 'z', 'T_profile' have
+        length Nz, so callers can plot or combine them directly.
     """
 
     # require caller to provide these solver parameters; no defaults allowed
@@ -271,6 +354,10 @@ def run_simulation(mat: Material,
     beta_default = params['beta']
     forcing = params['forcing']
     thickness = float(params['thickness'])
+    # convert the forcing series once so the RHS, evaluated many times by
+    # the solver, interpolates contiguous float arrays without conversions
+    forcing = {key: (np.ascontiguousarray(v, dtype=float) if np.ndim(v) else float(v))
+               for key, v in forcing.items()}
 
     # note that z is flipped for plotting in the output.
     Nz = DEFAULTS['Nz']
@@ -311,7 +398,8 @@ def run_simulation(mat: Material,
 
     # longwave upwelling from surface
     sigma = DEFAULTS['sigma']
-    Ldown = np.interp(times, forcing['t'], forcing['Ldown'])
+    Ldown_f = forcing['Ldown']
+    Ldown = np.interp(times, forcing['t'], Ldown_f) if np.ndim(Ldown_f) else np.full_like(times, float(Ldown_f))
     Lup = mat.emissivity * sigma * (Ts ** 4)
     Lstar = Ldown - Lup
 
@@ -352,9 +440,65 @@ def run_simulation(mat: Material,
         "T_profiles": T_profiles
     }
 
+
+def _min_max_loop(a):
+    """Single-pass NaN-skipping min/max over a 1D array for numba to compile."""
+    mi = np.inf
+    ma = -np.inf
+    for i in range(a.shape[0]):
+        v = a[i]
+        if v != v:
+            continue
+        if v < mi:
+            mi = v
+        if v > ma:
+            ma = v
+    return mi, ma
+
+
+_min_max_kernel = _njit(cache=True)(_min_max_loop) if _njit is not None else None
+
+
+def nan_min_max(a):
+    """Return ``(min, max)`` of ``a`` ignoring NaNs.
+
+    Uses a single pass over the data when numba is installed; otherwise
+    plain NumPy min/max, falling back to the NaN-aware reductions only if
+    the array contains NaNs. Returns ``(nan, nan)`` for an empty or
+    all-NaN array.
+    """
+    a = np.asarray(a, dtype=float)
+    if _min_max_kernel is not None:
+        mi, ma = _min_max_kernel(a.ravel())
+        if mi > ma:
+            return np.nan, np.nan
+        return float(mi), float(ma)
+    if a.size == 0:
+        return np.nan, np.nan
+    mi, ma = float(a.min()), float(a.max())
+    if not (np.isfinite(mi) and np.isfinite(ma)):
+        if np.isnan(a).all():
+            return np.nan, np.nan
+        mi, ma = float(np.nanmin(a)), float(np.nanmax(a))
+    return mi, ma
+
+
+def warm_up():
+    """Prepare a fresh process for model runs.
+
+    Loads the compiled kernels from numba's cache (a no-op without numba).
+    Submitting this function to a process pool also makes a spawned worker
+    import this module, and with it NumPy and SciPy.
+    """
+    nan_min_max(np.zeros(1))
+    diurnal_forcing(np.zeros(1), 293.15, 0.0, 0.0, 6 * hour, 18 * hour)
+
+
 if __name__ == "__main__":
-    # import app only for the demo/run-as-script path to avoid circular
-    # imports when `app` imports this module.
+    # pyplot is only needed for this demo: importing it at module level
+    # would resolve a GUI backend in the app and in every simulation worker
+    import matplotlib.pyplot as plt
+
     m = load_material("sandy_dry")
 
     # build forcing time series (high-resolution for interpolation)
@@ -367,8 +511,7 @@ if __name__ == "__main__":
                                      Sb=DEFAULTS['Sb'],
                                      trise=DEFAULTS['trise'],
                                      tset=DEFAULTS['tset'])
-    Ldown_arr = np.full_like(forcing_t, float(DEFAULTS['Ldown']))
-    forcing = {'t': forcing_t, 'Ta': Ta_arr, 'Kdown': S0_arr, 'Ldown': Ldown_arr}
+    forcing = {'t': forcing_t, 'Ta': Ta_arr, 'Kdown': S0_arr, 'Ldown': float(DEFAULTS['Ldown'])}
 
     params = {
         'beta': float(DEFAULTS['beta']),